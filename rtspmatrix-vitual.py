@@ -12,18 +12,35 @@
 
 import sys
 import os
-import json
 import math
 import signal
+import socket
 import threading
+import time
 import datetime
-import platform
-import configparser
+from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 from typing import Dict, List, Optional, Tuple
 
+# rtspmatrix_common does the platform bootstrap (XCB on Linux, libvlc.dll
+# search on Windows) and loads libVLC with a friendly error, so it must be
+# imported before vlc itself.
+from rtspmatrix_common import (
+    read_ini,
+    safe_read_json,
+    json_dumps,
+    safe_write_bytes_async,
+    safe_write_json_async,
+    flush_json_writes,
+    dispose_player_async,
+    join_disposal_threads,
+    bind_player_to_window as bind_player,
+    vlc_versions,
+    platform_string,
+)
 import vlc
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, QSocketNotifier, pyqtSignal
 from PyQt5.QtGui import QGuiApplication, QIcon, QPixmap, QImage
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QFrame,
@@ -51,62 +68,6 @@ def clamp_int(v, lo, hi, default):
     return max(lo, min(hi, v))
 
 
-def safe_read_json(path: str, default):
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return default
-
-
-def safe_write_json(path: str, obj):
-    tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
-    os.replace(tmp, path)
-
-
-def dispose_player_async(p: vlc.MediaPlayer):
-    # Detach from any OS window handle synchronously (on the caller/GUI thread)
-    # BEFORE the associated sink widget may be deleted.  Without this, libVLC
-    # can still try to render into a dead HWND/XWindow from its internal thread,
-    # causing a use-after-free crash.
-    try:
-        if sys.platform.startswith("linux"):
-            p.set_xwindow(0)
-        elif sys.platform.startswith("win"):
-            p.set_hwnd(0)
-        elif sys.platform.startswith("darwin"):
-            p.set_nsobject(0)
-        else:
-            p.set_xwindow(0)
-    except Exception:
-        pass
-
-    def _w():
-        try:
-            p.stop()
-        except Exception:
-            pass
-        try:
-            p.release()
-        except Exception:
-            pass
-    threading.Thread(target=_w, daemon=True).start()
-
-
-def bind_player(player: vlc.MediaPlayer, winid: int):
-    wid = int(winid)
-    if sys.platform.startswith("linux"):
-        player.set_xwindow(wid)
-    elif sys.platform.startswith("win"):
-        player.set_hwnd(wid)
-    elif sys.platform.startswith("darwin"):
-        player.set_nsobject(wid)
-    else:
-        player.set_xwindow(wid)
-
-
 def ensure_icon_assets():
     if os.path.exists(ICON_PATH):
         return
@@ -142,14 +103,74 @@ def ensure_icon_assets():
     pm.save(ICON_PATH, "PNG")
 
 
+def _compute_grid_dims(n: int) -> Tuple[int, int]:
+    # 2-row layout is reasonable for small counts (gives wide tiles),
+    # but for n >= 10 it becomes impractically wide (e.g. 2x8 for 16).
+    # Use sqrt-based layout for larger counts instead.
+    if n % 2 == 0 and n <= 8:
+        return 2, n // 2
+    # integer ceil(sqrt(n)) and ceil(n / cols): no float round-trips
+    cols = math.isqrt(n - 1) + 1
+    rows = (n + cols - 1) // cols
+    return rows, cols
+
+
+# (rows, cols) for every tile count 1..16; index 0 is unused.
+_GRID_DIMS: Tuple[Tuple[int, int], ...] = ((0, 0),) + tuple(_compute_grid_dims(n) for n in range(1, 17))
+
+
+# Channel numbers accepted from state/views JSON.  Paired with a
+# `type(x) is int` test: 3.0 and True hash equal to members but are not channels.
+_VALID_CHANNELS = frozenset(range(1, 17))
+
+# Minimum spacing between autorepeated arrow-key scroll steps (seconds).
+# Must stay longer than the 60 ms _scroll_timer debounce (see MainWindow).
+_SCROLL_REPEAT_S = 0.08
+
+
+# (attribute, JSON key, lo, hi) for the integer fields of views.json
+# entries, and of state.json (which also remembers the focused tile).
+_VIEW_INT_FIELDS = (
+    ("visible_panes",   "panes",           1, 16),
+    ("active_channels", "active_channels", 1, 16),
+    ("window_start",    "start",           0, 999),
+)
+_STATE_INT_FIELDS = _VIEW_INT_FIELDS + (
+    ("focus_idx",       "focus_idx",       0, 15),
+)
+
+
+def active_list_from_assign(assign) -> List[int]:
+    """Valid channels from a saved 16-slot assign list, first occurrence
+    wins, in slot order.  One pass; no None-padded intermediate list."""
+    if not isinstance(assign, list):
+        return []
+    # dict.fromkeys: order-preserving dedup
+    return list(dict.fromkeys(x for x in assign[:16]
+                              if type(x) is int and x in _VALID_CHANNELS))
+
+
+def assign_from_active_list(active_list) -> List[Optional[int]]:
+    """Inverse of active_list_from_assign: the 16-slot assign list saved in
+    views.json / state.json, None-padded."""
+    assign = [x if type(x) is int else None for x in islice(active_list, 16)]
+    assign += [None] * (16 - len(assign))
+    return assign
+
+
 # ---------------- config ----------------
 
 class RtspConfig:
+    # Fixed attribute set: no per-instance __dict__ on the per-open hot path.
+    __slots__ = (
+        "host", "port", "user", "password", "path", "subtype", "tcp",
+        "network_caching_ms", "rtsp_timeout_s", "no_audio", "low_latency",
+        "title", "default_panes", "views_file", "state_file",
+        "media_options", "_urls", "_media_cache",
+    )
+
     def __init__(self, ini_path: str = "rtsp.ini"):
-        cp = configparser.RawConfigParser(inline_comment_prefixes=())
-        ok = cp.read(ini_path, encoding="utf-8")
-        if not ok:
-            raise FileNotFoundError(f"Missing config file: {ini_path}")
+        cp = read_ini(ini_path)
 
         s = cp["rtsp"]
         self.host = s.get("host", "127.0.0.1")
@@ -161,6 +182,10 @@ class RtspConfig:
         self.tcp = s.getint("tcp", 1) != 0
         self.network_caching_ms = s.getint("network_caching_ms", 250)
         self.rtsp_timeout_s = s.getint("rtsp_timeout_s", 4)
+        # Tiles never play sound; skip audio output/decode per player.
+        self.no_audio = s.getint("no_audio", 1) != 0
+        # Display frames as decoded, without clock re-timing (see rtsp.ini).
+        self.low_latency = s.getint("low_latency", 1) != 0
 
         a = cp["app"] if cp.has_section("app") else {}
         self.title = a.get("title", APP_NAME)
@@ -168,9 +193,51 @@ class RtspConfig:
         self.views_file = a.get("views_file", "views.json")
         self.state_file = a.get("state_file", "state.json")
 
+        # Per-media options are the same for every channel; build them once.
+        opts = []
+        if self.user:
+            opts.append(f":rtsp-user={self.user}")
+        if self.password:
+            opts.append(f":rtsp-pwd={self.password}")
+        # RTSP-over-TCP, network caching and low_latency clocking are
+        # instance-wide (see MainWindow's vlc_args)
+        # hard timeout helps with dead channels; does not block UI
+        opts.append(f":rtsp-timeout={self.rtsp_timeout_s}")
+        self.media_options = tuple(opts)
+
+        # URLs never change after load; index 0 is a placeholder so the
+        # tuple can be indexed by channel number directly.
+        self._urls = ("",) + tuple(
+            f"rtsp://{self.host}:{self.port}{self.path}?channel={ch}&subtype={self.subtype}"
+            for ch in range(1, 17))
+        self._media_cache: Dict[int, vlc.Media] = {}
+
     def url(self, channel: int) -> str:
+        return self._urls[clamp_int(channel, 1, 16, 1)]
+
+    def get_media(self, vlc_instance: vlc.Instance, channel: int) -> vlc.Media:
+        """Cached vlc.Media per channel (URL + media_options applied once).
+        libVLC refcounts it on set_media(), so a channel re-added to the
+        pool reuses the same object.  libVLC 3.x does not update that
+        refcount atomically, so the GUI thread must not hand this Media to
+        a new player while a dispose worker is releasing the channel's
+        previous one: see PlayerPool._make_media."""
         ch = clamp_int(channel, 1, 16, 1)
-        return f"rtsp://{self.host}:{self.port}{self.path}?channel={ch}&subtype={self.subtype}"
+        m = self._media_cache.get(ch)
+        if m is None:
+            m = vlc_instance.media_new(self.url(ch))
+            for opt in self.media_options:
+                m.add_option(opt)
+            self._media_cache[ch] = m
+        return m
+
+    def release_media(self):
+        for m in self._media_cache.values():
+            try:
+                m.release()
+            except Exception:
+                pass
+        self._media_cache.clear()
 
 
 # ---------------- views ----------------
@@ -181,21 +248,35 @@ class ViewsStore:
         self.data = safe_read_json(self.path, {"views": {}})
         if not isinstance(self.data, dict) or "views" not in self.data or not isinstance(self.data["views"], dict):
             self.data = {"views": {}}
+        self._names = None
 
     def list_names(self):
-        return sorted(self.data["views"].keys(), key=str.lower)
+        # Sorted once per change of the name set, not on every combo reload.
+        if self._names is None:
+            self._names = tuple(sorted(self.data["views"].keys(), key=str.lower))
+        return self._names
 
     def get(self, name: str):
         return self.data["views"].get(name)
 
     def save_view(self, name: str, view_obj: dict):
+        if name not in self.data["views"]:
+            self._names = None
         self.data["views"][name] = view_obj
-        safe_write_json(self.path, self.data)
+        self._write()
 
     def delete(self, name: str):
         if name in self.data["views"]:
             del self.data["views"][name]
-            safe_write_json(self.path, self.data)
+            self._names = None
+            self._write()
+
+    def _write(self):
+        # Off the GUI thread; view objects are replaced, never mutated, so
+        # a shallow copy is a stable snapshot for the background writer.
+        snapshot = dict(self.data)
+        snapshot["views"] = dict(self.data["views"])
+        safe_write_json_async(self.path, snapshot)
 
 
 # ---------------- UI primitives ----------------
@@ -233,6 +314,10 @@ class HiddenSink(QFrame):
 
 
 class Tile(QWidget):
+    # Frame stylesheets, built once; set_focused swaps between them.
+    _STYLE_IDLE = "background: black; border: 3px solid #333;"
+    _STYLE_FOCUSED = "background: black; border: 3px solid #66aaff;"
+
     def __init__(self, idx: int, on_click, on_dblclick):
         super().__init__()
         self.idx = idx
@@ -243,15 +328,16 @@ class Tile(QWidget):
 
         self.frame = ClickableFrame(self)
         self.frame.setFrameShape(QFrame.Box)
-        self.frame.setStyleSheet("background: black; border: 3px solid #333;")
+        self.frame.setStyleSheet(self._STYLE_IDLE)
+        self._focused = False
         self.frame.setMinimumSize(160, 120)
         self.frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         # Each tile needs its own native OS window handle so VLC can render
         # into it independently.  Without this, winId() returns the toplevel
         # window's handle and all players render on top of each other.
         self.frame.setAttribute(Qt.WA_NativeWindow, True)
-        self.frame.clicked.connect(lambda: self.on_click(self))
-        self.frame.doubleClicked.connect(lambda: self.on_dblclick(self))
+        self.frame.clicked.connect(self._clicked)
+        self.frame.doubleClicked.connect(self._dblclicked)
 
         self.label = QLabel("Idle", self)
         self.label.setStyleSheet("color: #ddd;")
@@ -264,12 +350,21 @@ class Tile(QWidget):
         v.addWidget(self.label, 0)
 
         self.channel: Optional[int] = None
+        # (channel, fullscreen-locked) last applied by MainWindow._apply_window
+        self.shown: Optional[Tuple[int, bool]] = None
+
+    def _clicked(self):
+        self.on_click(self)
+
+    def _dblclicked(self):
+        self.on_dblclick(self)
 
     def set_focused(self, focused: bool):
-        if focused:
-            self.frame.setStyleSheet("background: black; border: 3px solid #66aaff;")
-        else:
-            self.frame.setStyleSheet("background: black; border: 3px solid #333;")
+        # setStyleSheet forces a style recompute + repaint; skip no-ops.
+        if focused == self._focused:
+            return
+        self._focused = focused
+        self.frame.setStyleSheet(self._STYLE_FOCUSED if focused else self._STYLE_IDLE)
 
 
 class ChannelListDialog(QDialog):
@@ -328,22 +423,13 @@ class AboutDialog(QDialog):
         text.setReadOnly(True)
 
         py_ver = sys.version.replace("\n", " ")
-        try:
-            pv_vlc = __import__("importlib").metadata.version("python-vlc")
-        except Exception:
-            pv_vlc = "unknown"
-        try:
-            libvlc_ver = vlc.libvlc_get_version()
-            if isinstance(libvlc_ver, bytes):
-                libvlc_ver = libvlc_ver.decode("utf-8", errors="ignore")
-            else:
-                libvlc_ver = str(libvlc_ver)
-        except Exception:
-            libvlc_ver = "unknown"
+        pv_vlc, libvlc_ver = vlc_versions()
+        pv_vlc = pv_vlc or "unknown"
+        libvlc_ver = libvlc_ver or "unknown"
 
         info = []
         info.append(f"App: {APP_NAME}")
-        info.append(f"OS: {platform.platform()}")
+        info.append(f"OS: {platform_string()}")
         info.append(f"Python: {py_ver}")
         info.append(f"python-vlc: {pv_vlc}")
         info.append(f"libVLC: {libvlc_ver}")
@@ -353,6 +439,8 @@ class AboutDialog(QDialog):
         info.append(f"TCP: {cfg.tcp}")
         info.append(f"network_caching_ms: {cfg.network_caching_ms}")
         info.append(f"rtsp_timeout_s: {cfg.rtsp_timeout_s}")
+        info.append(f"no_audio: {cfg.no_audio}")
+        info.append(f"low_latency: {cfg.low_latency}")
         info.append("")
         info.append(f"Displayed tiles: {panes} (grid {rows}x{cols})")
         info.append(f"Active channels count: {active_count}")
@@ -385,12 +473,24 @@ class AboutDialog(QDialog):
 
 # ---------------- buffering core ----------------
 
-@dataclass
+@dataclass(slots=True)
 class ChanPlayer:
     ch: int
     player: vlc.MediaPlayer
     sink: HiddenSink
     bound_to: int
+    # Generation token baked into this player's libVLC callbacks, so late
+    # events from a released player for the same channel are dropped.
+    gen: int = 0
+    # Last state reported by libVLC events (GUI thread only).
+    state: str = "opening"
+
+
+# How long a channel that left the desired set keeps its session (on its
+# hidden sink) before it is released, so scrolling or flipping the active
+# count back and forth doesn't reconnect it every time.  An explicit
+# exclusion skips the grace (PlayerPool.release_now).
+_RELEASE_GRACE_S = 1.0
 
 
 class PlayerPool:
@@ -399,58 +499,183 @@ class PlayerPool:
       channel -> MediaPlayer
     Only channels within (window + left/right buffer) exist.
     Moving the window by 1 means:
-      - 1 channel leaves desired set -> player released
+      - 1 channel leaves desired set -> player released (after
+        _RELEASE_GRACE_S; re-desired within it, it is simply kept)
       - 1 channel enters desired set -> player created and connected
       - kept channels never reconnect
+
+    State changes are pushed by libVLC events (no polling): `on_state` is
+    called as on_state(ch, gen, name) from libVLC's own threads, so it must
+    only hand off to the GUI thread (e.g. a Qt signal emit).
     """
-    def __init__(self, vlc_instance: vlc.Instance, cfg: RtspConfig, parent_widget: QWidget):
+
+    # Map vlc.EventType -> short name string passed to on_state.
+    _EVENT_MAP = {
+        vlc.EventType.MediaPlayerOpening:          "opening",
+        vlc.EventType.MediaPlayerPlaying:          "playing",
+        vlc.EventType.MediaPlayerPaused:           "paused",
+        vlc.EventType.MediaPlayerStopped:          "stopped",
+        vlc.EventType.MediaPlayerEndReached:       "ended",
+        vlc.EventType.MediaPlayerEncounteredError: "error",
+    }
+
+    def __init__(self, vlc_instance: vlc.Instance, cfg: RtspConfig, parent_widget: QWidget,
+                 on_state=None):
         self.vlc = vlc_instance
         self.cfg = cfg
         self.parent = parent_widget
+        self.on_state = on_state
         self.by_channel: Dict[int, ChanPlayer] = {}
+        self._gen = 0
+        # (channel, gen) of players set up by ensure() but not yet started.
+        # One play() per event-loop pass, so a full reload doesn't fire all
+        # RTSP handshakes in one burst and the GUI keeps repainting.
+        self._start_queue = deque()
+        self._start_timer = QTimer(parent_widget)
+        self._start_timer.setInterval(0)
+        self._start_timer.timeout.connect(self._start_next)
+        # channel -> monotonic release deadline for undesired channels.
+        self._release_at: Dict[int, float] = {}
+        self._release_timer = QTimer(parent_widget)
+        self._release_timer.setSingleShot(True)
+        self._release_timer.timeout.connect(self._release_expired)
+        # channel -> players of that channel still queued/running on a
+        # vlc-dispose worker.  Decremented from the worker threads.
+        self._disposing: Dict[int, int] = {}
+        self._disposing_lock = threading.Lock()
+
+    def _wire_events(self, p: vlc.MediaPlayer, ch: int, gen: int):
+        if self.on_state is None:
+            return
+        em = p.event_manager()
+        for ev_type, name in self._EVENT_MAP.items():
+            def _cb(_event, _ch=ch, _gen=gen, _name=name):
+                try:
+                    self.on_state(_ch, _gen, _name)
+                except Exception:
+                    pass
+            try:
+                em.event_attach(ev_type, _cb)
+            except Exception:
+                pass
 
-    def _make_media(self, ch: int) -> vlc.Media:
+    def _make_media(self, ch: int) -> Tuple[vlc.Media, bool]:
+        """Media for a new player of `ch`, and whether it is a private
+        one the caller must release after set_media().
+
+        The shared per-channel Media is used unless the channel's previous
+        player is still being disposed: releasing that player releases its
+        Media on the worker thread, which would race this thread's
+        set_media() retain of the same object."""
+        with self._disposing_lock:
+            busy = ch in self._disposing
+        if not busy:
+            return self.cfg.get_media(self.vlc, ch), False
         m = self.vlc.media_new(self.cfg.url(ch))
-        if self.cfg.user:
-            m.add_option(f":rtsp-user={self.cfg.user}")
-        if self.cfg.password:
-            m.add_option(f":rtsp-pwd={self.cfg.password}")
-        if self.cfg.tcp:
-            m.add_option(":rtsp-tcp")
-        m.add_option(f":network-caching={self.cfg.network_caching_ms}")
-        # hard timeout helps with dead channels; does not block UI
-        m.add_option(f":rtsp-timeout={self.cfg.rtsp_timeout_s}")
-        return m
-
-    def ensure(self, desired_channels: List[int]):
+        for opt in self.cfg.media_options:
+            m.add_option(opt)
+        return m, True
+
+    def ensure(self, desired_channels: List[int], initial_bind: Optional[Dict[int, int]] = None):
+        """Release undesired channels and start any missing ones.
+
+        `initial_bind` maps channel -> winid for channels about to be shown
+        in a tile: a new player is bound straight to that drawable instead
+        of its hidden sink, so it never needs an immediate rebind.  All new
+        players are set up first; their play() calls are then queued,
+        tile-bound ones first, and issued one per event-loop pass.
+        """
         desired = [int(x) for x in desired_channels if isinstance(x, int)]
         desired_set = set(desired)
 
-        # remove undesired
-        for ch in list(self.by_channel.keys()):
-            if ch not in desired_set:
-                cp = self.by_channel.pop(ch)
-                dispose_player_async(cp.player)
-                try:
-                    cp.sink.setParent(None)
-                    cp.sink.deleteLater()
-                except Exception:
-                    pass
-
-        # add missing (start playing immediately on hidden sink)
+        # park undesired on their hidden sink; _release_expired drops them
+        deadline = time.monotonic() + _RELEASE_GRACE_S
+        for ch in self.by_channel:
+            if ch in desired_set:
+                self._release_at.pop(ch, None)
+            elif ch not in self._release_at:
+                self._release_at[ch] = deadline
+                self.bind_hidden(ch)
+        if self._release_at and not self._release_timer.isActive():
+            self._release_timer.start(int(_RELEASE_GRACE_S * 1000))
+
+        # add missing (bound to their tile if visible, else the hidden sink)
+        visible_new = []
+        buffered_new = []
         for ch in desired:
             if ch in self.by_channel:
                 continue
             p = self.vlc.media_player_new()
             sink = HiddenSink(self.parent)
-            bind_player(p, int(sink.winId()))
-            m = self._make_media(ch)
+            wid = initial_bind.get(ch) if initial_bind else None
+            (buffered_new if wid is None else visible_new).append(ch)
+            if wid is None:
+                wid = int(sink.winId())
+            bind_player(p, wid)
+            self._gen += 1
+            self._wire_events(p, ch, self._gen)
+            m, private = self._make_media(ch)
             p.set_media(m)
+            if private:
+                m.release()  # the player holds its own reference
+            self.by_channel[ch] = ChanPlayer(ch=ch, player=p, sink=sink,
+                                             bound_to=wid, gen=self._gen)
+
+        for ch in visible_new + buffered_new:
+            self._start_queue.append((ch, self.by_channel[ch].gen))
+        if self._start_queue and not self._start_timer.isActive():
+            self._start_timer.start()
+
+    def _release(self, ch: int):
+        cp = self.by_channel.pop(ch)
+        with self._disposing_lock:
+            self._disposing[ch] = self._disposing.get(ch, 0) + 1
+        dispose_player_async(cp.player, on_done=lambda: self._disposed(ch))
+        try:
+            cp.sink.setParent(None)
+            cp.sink.deleteLater()
+        except Exception:
+            pass
+
+    def _disposed(self, ch: int):
+        # vlc-dispose worker thread
+        with self._disposing_lock:
+            n = self._disposing.get(ch, 0) - 1
+            if n > 0:
+                self._disposing[ch] = n
+            else:
+                self._disposing.pop(ch, None)
+
+    def release_now(self, ch: int):
+        """Release a parked (undesired) channel without waiting out its
+        grace period.  A channel that is still desired is left alone."""
+        if self._release_at.pop(ch, None) is not None:
+            self._release(ch)
+
+    def _release_expired(self):
+        now = time.monotonic()
+        for ch, at in list(self._release_at.items()):
+            if at <= now:
+                del self._release_at[ch]
+                self._release(ch)
+        if self._release_at:
+            wait = min(self._release_at.values()) - now
+            self._release_timer.start(max(1, int(wait * 1000)))
+
+    def _start_next(self):
+        while self._start_queue:
+            ch, gen = self._start_queue.popleft()
+            cp = self.by_channel.get(ch)
+            # Released (or released and recreated) before its turn came.
+            if cp is None or cp.gen != gen:
+                continue
             try:
-                p.play()
+                cp.player.play()
             except Exception:
                 pass
-            self.by_channel[ch] = ChanPlayer(ch=ch, player=p, sink=sink, bound_to=int(sink.winId()))
+            break
+        if not self._start_queue:
+            self._start_timer.stop()
 
     def get(self, ch: int) -> Optional[vlc.MediaPlayer]:
         cp = self.by_channel.get(int(ch))
@@ -483,14 +708,12 @@ class PlayerPool:
             pass
 
     def shutdown(self):
+        self._start_timer.stop()
+        self._start_queue.clear()
+        self._release_timer.stop()
+        self._release_at.clear()
         for ch in list(self.by_channel.keys()):
-            cp = self.by_channel.pop(ch)
-            dispose_player_async(cp.player)
-            try:
-                cp.sink.setParent(None)
-                cp.sink.deleteLater()
-            except Exception:
-                pass
+            self._release(ch)
 
 
 # ---------------- fullscreen ----------------
@@ -518,11 +741,16 @@ class FullScreenWindow(QMainWindow):
         # WA_NativeWindow gives this child widget its own OS-level window handle
         # so VLC binds to the video area specifically, not to the whole QMainWindow.
         self.video.setAttribute(Qt.WA_NativeWindow, True)
-        self.video.clicked.connect(lambda: QTimer.singleShot(0, self.close))
+        self.video.clicked.connect(self._video_clicked)
         v.addWidget(self.video, 1)
 
         self.current_channel: Optional[int] = None
 
+    def _video_clicked(self):
+        # Deferred: closing from inside the frame's own mousePressEvent
+        # would destroy the emitting widget mid-event.
+        QTimer.singleShot(0, self.close)
+
     def show_channel(self, ch: int):
         self.current_channel = int(ch)
         self.setWindowTitle(f"{APP_NAME} - CH{self.current_channel}")
@@ -562,21 +790,46 @@ class FullScreenWindow(QMainWindow):
 # ---------------- main window ----------------
 
 class MainWindow(QMainWindow):
+    # (channel, pool generation, state name) — emitted from libVLC threads,
+    # delivered on the GUI thread via the default queued connection.
+    chan_state = pyqtSignal(int, int, str)
+
     def __init__(self):
         super().__init__()
         self._cleaned = False
+        self._last_state_blob = None
+        self._views_names = None
+        self._streams_started = False
+        # Build the whole widget tree with painting frozen; every child
+        # inherits this, so adding 16 buttons + 16 tiles doesn't trigger a
+        # cascade of intermediate repaints.  Re-enabled at the end.
+        self.setUpdatesEnabled(False)
 
         ensure_icon_assets()
         self.cfg = RtspConfig("rtsp.ini")
         self.views = ViewsStore(self.cfg.views_file)
 
-        vlc_args = ["--no-video-title-show"]
+        # Tiles are bare video: no OSD, subtitles, Lua extensions or input
+        # statistics (nothing here reads MediaStats).
+        vlc_args = [
+            "--quiet",
+            "--no-video-title-show",
+            "--no-osd",
+            "--no-spu",
+            "--no-stats",
+            "--no-lua",
+        ]
         if self.cfg.tcp:
             vlc_args.append("--rtsp-tcp")
         vlc_args.append(f"--network-caching={self.cfg.network_caching_ms}")
+        if self.cfg.low_latency:
+            vlc_args += ["--clock-jitter=0", "--clock-synchro=0"]
+        if self.cfg.no_audio:
+            vlc_args.append("--no-audio")
         self.vlc = vlc.Instance(vlc_args)
 
-        self.pool = PlayerPool(self.vlc, self.cfg, self)
+        self.chan_state.connect(self._on_chan_state)
+        self.pool = PlayerPool(self.vlc, self.cfg, self, on_state=self.chan_state.emit)
 
         # state
         self.visible_panes = clamp_int(self.cfg.default_panes, 1, 16, 4)
@@ -591,7 +844,6 @@ class MainWindow(QMainWindow):
         # fullscreen lock: while fullscreen open, this channel is not allowed to be rebound to tiles/sinks
         self.fullscreen: Optional[FullScreenWindow] = None
         self.fullscreen_channel: Optional[int] = None
-        self.fullscreen_return_tile_winid: Optional[int] = None
 
         # channels excluded from the active rotation; right-click a button to toggle
         self.excluded: set = set()
@@ -623,8 +875,7 @@ class MainWindow(QMainWindow):
             b.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             # Right-click → exclude / include context menu
             b.setContextMenuPolicy(Qt.CustomContextMenu)
-            b.customContextMenuRequested.connect(
-                lambda _pos, c=ch: self._on_channel_btn_context(c))
+            b.customContextMenuRequested.connect(self._on_channel_btn_menu_requested)
             self.btn_channels.addButton(b, ch)
             btn_grid.addWidget(b, i // 8, i % 8)
         main.addLayout(btn_grid)
@@ -669,16 +920,46 @@ class MainWindow(QMainWindow):
         main.addLayout(controls)
 
         self.info = QLabel("", self)
+        # (focus_idx, window_start, visible channels) last shown in self.info
+        self._last_info_key = None
         self.info.setStyleSheet("color: #ddd;")
         main.addWidget(self.info)
 
         self.panes_grid = QGridLayout()
         self.panes_grid.setSpacing(8)
         main.addLayout(self.panes_grid, 1)
+        # Last layout built / stretches applied; identical rebuilds are skipped.
+        self._grid_key: Optional[Tuple[int, int, int]] = None
+        self._stretch_dims: Optional[Tuple[int, int]] = None
+        # Grid cell each tile currently occupies (None = hidden, out of the
+        # layout; () = not placed yet).  Only tiles whose cell changes are
+        # touched by _rebuild_grid.
+        self._tile_cells: List[Optional[Tuple[int, int]]] = [()] * 16
 
         # tiles
         self.tiles: List[Tile] = [Tile(i + 1, self._on_tile_click, self._on_tile_dblclick) for i in range(16)]
 
+        # Debounced scroll: ◀/▶ clicks and arrow keys move window_start right
+        # away; the pool/tile rebind runs 60 ms after the last step, so steps
+        # closer together than that share one _apply_window.  Autorepeated
+        # steps are throttled to one per _SCROLL_REPEAT_S, which is kept
+        # longer than the debounce on purpose: the timer fires between them,
+        # so a held key keeps the view following it, applying the window at
+        # most once per throttle period whatever the OS repeat rate.
+        self._last_scroll_t = 0.0
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(60)
+        self._scroll_timer.timeout.connect(self._apply_scrolled_window)
+
+        # Debounced state saver, as in the classic viewer: every applied
+        # window / focus change requests a save; the write happens 500 ms
+        # after the last request, so a crash loses at most that much.
+        self._save_state_timer = QTimer(self)
+        self._save_state_timer.setSingleShot(True)
+        self._save_state_timer.setInterval(500)
+        self._save_state_timer.timeout.connect(self._save_state)
+
         # restore
         self._reload_views_combo()
         self._restore_state()
@@ -688,8 +969,8 @@ class MainWindow(QMainWindow):
         self.btn_channels.idClicked.connect(self.on_channel_pressed)
         self.cmb_panes.currentTextChanged.connect(self._on_panes_changed)
         self.cmb_active.currentTextChanged.connect(self._on_active_changed)
-        self.btn_left.clicked.connect(lambda: self.scroll_by(-1))
-        self.btn_right.clicked.connect(lambda: self.scroll_by(+1))
+        self.btn_left.clicked.connect(self._scroll_left)
+        self.btn_right.clicked.connect(self._scroll_right)
         self.btn_apply_view.clicked.connect(self.apply_selected_view)
         self.btn_save_view.clicked.connect(self.save_view_dialog)
         self.btn_delete_view.clicked.connect(self.delete_selected_view)
@@ -709,16 +990,18 @@ class MainWindow(QMainWindow):
         self._rebuild_grid()
         self._clamp_active_list_to_count()
         self._clamp_window_start()
-        self._apply_window()
         self._update_focus()
         self._update_scroll_buttons()
         self._refresh_channel_buttons()
+        self.setUpdatesEnabled(True)
 
-        # label refresh (cheap), no per-channel timers
-        self.state_timer = QTimer(self)
-        self.state_timer.setInterval(400)
-        self.state_timer.timeout.connect(self._refresh_labels)
-        self.state_timer.start()
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._streams_started:
+            # First show: let the window paint, then create players and
+            # start RTSP from the event loop (see _apply_window).
+            self._streams_started = True
+            QTimer.singleShot(0, self._apply_window)
 
     # ---------- menu ----------
 
@@ -740,50 +1023,54 @@ class MainWindow(QMainWindow):
     # ---------- grid ----------
 
     def _grid_dims(self, n: int) -> Tuple[int, int]:
-        n = clamp_int(n, 1, 16, 4)
-        # 2-row layout is reasonable for small counts (gives wide tiles),
-        # but for n >= 10 it becomes impractically wide (e.g. 2x8 for 16).
-        # Use sqrt-based layout for larger counts instead.
-        if n % 2 == 0 and n <= 8:
-            return 2, n // 2
-        cols = int(math.ceil(math.sqrt(n)))
-        rows = int(math.ceil(n / cols))
-        return rows, cols
-
-    def _clear_layout(self, layout: QGridLayout):
-        while layout.count():
-            item = layout.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.setParent(None)
-
-    def _reset_grid_stretch(self):
-        for i in range(0, 16):
-            self.panes_grid.setRowStretch(i, 0)
-            self.panes_grid.setColumnStretch(i, 0)
+        return _GRID_DIMS[clamp_int(n, 1, 16, 4)]
 
     def _apply_grid_stretch(self, rows: int, cols: int):
-        self._reset_grid_stretch()
-        for r in range(rows):
-            self.panes_grid.setRowStretch(r, 1)
-        for c in range(cols):
-            self.panes_grid.setColumnStretch(c, 1)
+        """Stretch 1 on rows/cols in use, 0 elsewhere.  Only the rows and
+        columns between the old and new size change, so only those are
+        set (a fresh QGridLayout has every stretch at 0)."""
+        if self._stretch_dims == (rows, cols):
+            return
+        old_rows, old_cols = self._stretch_dims or (0, 0)
+        self._stretch_dims = (rows, cols)
+        for r in range(min(rows, old_rows), max(rows, old_rows)):
+            self.panes_grid.setRowStretch(r, 1 if r < rows else 0)
+        for c in range(min(cols, old_cols), max(cols, old_cols)):
+            self.panes_grid.setColumnStretch(c, 1 if c < cols else 0)
 
     def _rebuild_grid(self):
         self.grid_rows, self.grid_cols = self._grid_dims(self.visible_panes)
-        self._clear_layout(self.panes_grid)
-
-        for i in range(16):
-            t = self.tiles[i]
-            if i < self.visible_panes:
-                t.setVisible(True)
-                r = i // self.grid_cols
-                c = i % self.grid_cols
-                self.panes_grid.addWidget(t, r, c)
-            else:
-                t.setVisible(False)
+        key = (self.visible_panes, self.grid_rows, self.grid_cols)
+        if key == self._grid_key:
+            if self.focus_idx >= self.visible_panes:
+                self.focus_idx = 0
+            return
+        self._grid_key = key
+
+        # Move tiles between cells in place: removeWidget + addWidget keeps
+        # the Qt parent, so tiles are not reparented and their native
+        # window handles (which visible players are bound to) survive.
+        # Painting is frozen meanwhile so the moves land as one repaint.
+        host = self.centralWidget()
+        host.setUpdatesEnabled(False)
+        try:
+            cells = self._tile_cells
+            for i, t in enumerate(self.tiles):
+                cell = divmod(i, self.grid_cols) if i < self.visible_panes else None
+                if cell == cells[i]:
+                    continue
+                if cells[i]:
+                    self.panes_grid.removeWidget(t)
+                if cell is None:
+                    t.setVisible(False)
+                else:
+                    self.panes_grid.addWidget(t, *cell)
+                    t.setVisible(True)
+                cells[i] = cell
 
-        self._apply_grid_stretch(self.grid_rows, self.grid_cols)
+            self._apply_grid_stretch(self.grid_rows, self.grid_cols)
+        finally:
+            host.setUpdatesEnabled(True)
 
         if self.focus_idx >= self.visible_panes:
             self.focus_idx = 0
@@ -793,22 +1080,18 @@ class MainWindow(QMainWindow):
     def _clamp_active_list_to_count(self):
         self.active_channels = clamp_int(self.active_channels, 1, 16, 16)
 
-        tmp = []
-        seen = set()
-        for x in self.active_list:
-            if isinstance(x, int) and 1 <= x <= 16 and x not in seen:
-                tmp.append(x)
-                seen.add(x)
-        self.active_list = tmp
-
-        if len(self.active_list) > self.active_channels:
-            self.active_list = self.active_list[:self.active_channels]
-        elif len(self.active_list) < self.active_channels:
+        # dict.fromkeys: order-preserving dedup in one C-level pass
+        self.active_list = [x for x in dict.fromkeys(self.active_list)
+                            if type(x) is int and x in _VALID_CHANNELS]
+
+        short = self.active_channels - len(self.active_list)
+        if short < 0:
+            del self.active_list[self.active_channels:]
+        elif short > 0:
             # Never pad with excluded channels
-            existing = set(self.active_list)
-            missing = [c for c in range(1, 17)
-                       if c not in existing and c not in self.excluded]
-            self.active_list.extend(missing[: (self.active_channels - len(self.active_list))])
+            taken = self.excluded.union(self.active_list)
+            self.active_list.extend(
+                islice((c for c in range(1, 17) if c not in taken), short))
 
     def _max_start(self) -> int:
         return max(0, len(self.active_list) - self.visible_panes)
@@ -817,12 +1100,9 @@ class MainWindow(QMainWindow):
         self.window_start = clamp_int(self.window_start, 0, self._max_start(), 0)
 
     def _visible_channels(self) -> List[int]:
-        out = []
-        for i in range(self.visible_panes):
-            idx = self.window_start + i
-            if 0 <= idx < len(self.active_list):
-                out.append(self.active_list[idx])
-        return out
+        # One C-level slice; called on every scroll, focus change and apply.
+        start = max(0, self.window_start)
+        return self.active_list[start:start + self.visible_panes]
 
     def _desired_channels(self) -> List[int]:
         """Return the complete set of channels that must stay connected.
@@ -836,6 +1116,11 @@ class MainWindow(QMainWindow):
         return list(self.active_list)
 
     def _apply_window(self):
+        # Any pending debounced scroll is covered by this call.
+        self._scroll_timer.stop()
+        if self._cleaned:
+            # A queued first-show/scroll call landing after cleanup().
+            return
         self._clamp_active_list_to_count()
         self._clamp_window_start()
 
@@ -843,62 +1128,83 @@ class MainWindow(QMainWindow):
         desired = self._desired_channels()
         visible = self._visible_channels()
 
-        self.pool.ensure(desired)
+        # Drawables for the visible tiles, so newly added channels start
+        # directly in their tile (fullscreen channel keeps its drawable).
+        tile_winids = {}
+        for i, ch in enumerate(visible):
+            if self.fullscreen_channel is not None and ch == self.fullscreen_channel:
+                continue
+            tile_winids[ch] = int(self.tiles[i].frame.winId())
 
-        # bind visible channels to tiles (rebind only; no reconnect)
+        self.pool.ensure(desired, initial_bind=tile_winids)
+
+        # bind visible channels to tiles (rebind only; no reconnect).
+        # Diff against what each tile showed last time: a tile that keeps
+        # its channel (and fullscreen lock state) keeps its label, and
+        # bind_to is already a no-op for a player bound to that tile, so a
+        # scroll by one only rewires the tiles whose channel changed.
         for i in range(self.visible_panes):
             t = self.tiles[i]
-            idx = self.window_start + i
-            if 0 <= idx < len(self.active_list):
-                ch = self.active_list[idx]
-                t.channel = ch
+            if i < len(visible):
+                ch = visible[i]
+                is_fs = self.fullscreen_channel is not None and ch == self.fullscreen_channel
+                shown = (ch, is_fs)
+            else:
+                ch = None
+                is_fs = False
+                shown = None
+            if ch is not None and not is_fs:
+                self.pool.bind_to(ch, tile_winids[ch])
+            if shown is not None and t.shown == shown:
+                continue
+            t.channel = ch
+            t.shown = shown
 
+            if ch is None:
+                t.label.setText("Idle")
+            elif is_fs:
                 # fullscreen lock: do not steal drawable for the fullscreen channel
-                if self.fullscreen_channel is not None and ch == self.fullscreen_channel:
-                    t.label.setText(f"CH{ch} (FS)")
-                else:
-                    self.pool.bind_to(ch, int(t.frame.winId()))
-                    t.label.setText(f"CH{ch}")
+                t.label.setText(f"CH{ch} (FS)")
             else:
-                t.channel = None
-                t.label.setText("Idle")
+                t.label.setText(self._channel_label(ch))
+        # Hidden tiles miss state events; make them relabel when shown again.
+        for t in self.tiles[self.visible_panes:]:
+            t.shown = None
 
         # bind buffered but not visible to hidden sinks (keep sessions warm)
+        visible_set = set(visible)
         for ch in desired:
-            if ch in visible:
+            if ch in visible_set:
                 continue
             if self.fullscreen_channel is not None and ch == self.fullscreen_channel:
                 continue
             self.pool.bind_hidden(ch)
 
-    # ---------- labels (state sampling) ----------
+        self._request_save_state()
+
+    # ---------- labels (libVLC events) ----------
 
-    def _refresh_labels(self):
+    _STATE_SUFFIX = {"playing": " playing", "opening": " opening", "error": " ERR"}
+
+    def _channel_label(self, ch: int) -> str:
+        cp = self.pool.by_channel.get(ch)
+        # keep short and stable for anything not in _STATE_SUFFIX
+        suffix = self._STATE_SUFFIX.get(cp.state, "") if cp else ""
+        return f"CH{ch}{suffix}"
+
+    def _on_chan_state(self, ch: int, gen: int, name: str):
+        cp = self.pool.by_channel.get(ch)
+        # Stale event from a released player for this channel — ignore.
+        if cp is None or cp.gen != gen:
+            return
+        cp.state = name
+        if self.fullscreen_channel is not None and ch == self.fullscreen_channel:
+            return
         # visible tiles only; no scanning of whole pool
         for i in range(self.visible_panes):
             t = self.tiles[i]
-            ch = t.channel
-            if not isinstance(ch, int):
-                continue
-            if self.fullscreen_channel is not None and ch == self.fullscreen_channel:
-                continue
-            p = self.pool.get(ch)
-            if not p:
-                continue
-            try:
-                st = p.get_state()
-            except Exception:
-                st = vlc.State.Error
-
-            if st == vlc.State.Playing:
-                t.label.setText(f"CH{ch} playing")
-            elif st in (vlc.State.Opening, vlc.State.Buffering):
-                t.label.setText(f"CH{ch} opening")
-            elif st == vlc.State.Error:
-                t.label.setText(f"CH{ch} ERR")
-            else:
-                # keep short and stable
-                t.label.setText(f"CH{ch}")
+            if t.channel == ch:
+                t.label.setText(self._channel_label(ch))
 
     # ---------- focus / scrolling ----------
 
@@ -908,6 +1214,7 @@ class MainWindow(QMainWindow):
             return
         self.focus_idx = idx
         self._update_focus()
+        self._request_save_state()
         # Defer by one event-loop tick so the mousePressEvent stack unwinds
         # before showFullScreen() is called.  Calling showFullScreen() directly
         # from inside mousePressEvent confuses Qt's event delivery on most
@@ -921,25 +1228,39 @@ class MainWindow(QMainWindow):
         pass
 
     def _tile_index(self, tile: Tile) -> Optional[int]:
-        for i in range(self.visible_panes):
-            if self.tiles[i] is tile:
-                return i
+        # Tiles never move in self.tiles, so tile.idx (1-based) is its slot.
+        i = tile.idx - 1
+        if 0 <= i < self.visible_panes and self.tiles[i] is tile:
+            return i
         return None
 
     def scroll_by(self, delta: int):
         self.window_start += int(delta)
         self._clamp_window_start()
+        # restart-safe: only the last scroll of a burst reaches _apply_window
+        # and the info/focus refresh.  The scroll buttons depend only on the
+        # list length, which a scroll never changes.
+        self._scroll_timer.start()
+
+    def _apply_scrolled_window(self):
         self._apply_window()
         self._update_focus()
-        self._update_scroll_buttons()
+
+    def _scroll_left(self):
+        self.scroll_by(-1)
+
+    def _scroll_right(self):
+        self.scroll_by(+1)
 
     def keyPressEvent(self, event):
         if self.fullscreen is None:
-            if event.key() == Qt.Key_Left:
-                self.scroll_by(-1)
-                return
-            if event.key() == Qt.Key_Right:
-                self.scroll_by(+1)
+            key = event.key()
+            if key in (Qt.Key_Left, Qt.Key_Right):
+                now = time.monotonic()
+                if event.isAutoRepeat() and now - self._last_scroll_t < _SCROLL_REPEAT_S:
+                    return
+                self._last_scroll_t = now
+                self.scroll_by(-1 if key == Qt.Key_Left else +1)
                 return
         super().keyPressEvent(event)
 
@@ -947,8 +1268,14 @@ class MainWindow(QMainWindow):
         for i in range(self.visible_panes):
             self.tiles[i].set_focused(i == self.focus_idx)
 
+        # Compare the inputs, not the text: an unchanged line costs no
+        # formatting (the list repr is the expensive part) and no setText.
         vis = self._visible_channels()
-        self.info.setText(f"Focus: {self.focus_idx + 1} | Start: {self.window_start} | Visible: {vis}")
+        key = (self.focus_idx, self.window_start, vis)
+        if key != self._last_info_key:
+            self._last_info_key = key
+            self.info.setText(
+                f"Focus: {self.focus_idx + 1} | Start: {self.window_start} | Visible: {vis}")
 
     def _update_scroll_buttons(self):
         enable = len(self.active_list) > self.visible_panes
@@ -971,6 +1298,12 @@ class MainWindow(QMainWindow):
         for ch in to_include:
             self.toggle_exclude(ch)
 
+    def _on_channel_btn_menu_requested(self, _pos):
+        # One slot shared by all 16 buttons; the group maps sender -> channel.
+        ch = self.btn_channels.id(self.sender())
+        if ch > 0:
+            self._on_channel_btn_context(ch)
+
     def _on_channel_btn_context(self, ch: int):
         """Right-click context menu on a channel number button."""
         menu = QMenu(self)
@@ -994,7 +1327,8 @@ class MainWindow(QMainWindow):
                 self.active_channels = len(self.active_list)
         else:
             self.excluded.add(ch)
-            # Remove from active_list immediately; pool will release the player
+            # Remove from active_list; the player is released below, once
+            # _apply_window has taken it out of the desired set.
             if ch in self.active_list:
                 self.active_list.remove(ch)
                 self.active_channels = len(self.active_list)
@@ -1005,6 +1339,10 @@ class MainWindow(QMainWindow):
         self.cmb_active.blockSignals(False)
         self._clamp_window_start()
         self._apply_window()
+        if ch in self.excluded:
+            # Deliberate, not scroll churn: don't keep streaming it for the
+            # release grace period.
+            self.pool.release_now(ch)
         self._update_focus()
         self._update_scroll_buttons()
 
@@ -1027,16 +1365,22 @@ class MainWindow(QMainWindow):
     def on_channel_pressed(self, ch: int):
         ch = clamp_int(ch, 1, 16, 1)
 
-        # ensure channel exists in active_list
-        if ch not in self.active_list:
+        # ensure channel exists in active_list (one scan, not "in" + index)
+        try:
+            idx = self.active_list.index(ch)
+        except ValueError:
             if len(self.active_list) < 16:
                 self.active_list.append(ch)
                 self.active_channels = len(self.active_list)
+                # Silently: _on_active_changed would run a full
+                # _apply_window pass ahead of the one below.
+                self.cmb_active.blockSignals(True)
                 self.cmb_active.setCurrentText(str(self.active_channels))
+                self.cmb_active.blockSignals(False)
+                idx = len(self.active_list) - 1
             else:
                 self.active_list[-1] = ch
-
-        idx = self.active_list.index(ch)
+                idx = 15
         desired_start = idx - self.focus_idx
         self.window_start = clamp_int(desired_start, 0, self._max_start(), 0)
         self._apply_window()
@@ -1057,7 +1401,6 @@ class MainWindow(QMainWindow):
 
         self.fullscreen = FullScreenWindow(self)
         self.fullscreen_channel = ch
-        self.fullscreen_return_tile_winid = int(tile.frame.winId())
 
         # bind player to fullscreen drawable
         self.fullscreen.showFullScreen()
@@ -1104,7 +1447,6 @@ class MainWindow(QMainWindow):
         # on close: release fullscreen lock and restore tile bindings
         self.fullscreen = None
         self.fullscreen_channel = None
-        self.fullscreen_return_tile_winid = None
         self._apply_window()
         self._update_focus()
 
@@ -1129,34 +1471,16 @@ class MainWindow(QMainWindow):
     # ---------- views ----------
 
     def _reload_views_combo(self):
+        # Overwriting an existing view leaves the name list as it was;
+        # don't reset the combo's model for nothing.
         names = self.views.list_names()
+        if names == self._views_names:
+            return
+        self._views_names = names
+        self.cmb_views.blockSignals(True)
         self.cmb_views.clear()
-        self.cmb_views.addItem("")
-        for n in names:
-            self.cmb_views.addItem(n)
-
-    def _normalize_assign_list(self, assign):
-        if not isinstance(assign, list):
-            return [None] * 16
-        out = []
-        for x in assign[:16]:
-            if isinstance(x, int) and 1 <= x <= 16:
-                out.append(x)
-            else:
-                out.append(None)
-        while len(out) < 16:
-            out.append(None)
-        return out
-
-    def _active_list_from_assign(self, assign):
-        a = self._normalize_assign_list(assign)
-        seen = set()
-        out = []
-        for x in a:
-            if isinstance(x, int) and x not in seen:
-                out.append(x)
-                seen.add(x)
-        return out
+        self.cmb_views.addItems([""] + list(names))
+        self.cmb_views.blockSignals(False)
 
     def apply_selected_view(self):
         name = self.cmb_views.currentText().strip()
@@ -1166,14 +1490,18 @@ class MainWindow(QMainWindow):
         if not isinstance(v, dict):
             return
 
-        self.visible_panes = clamp_int(v.get("panes", self.visible_panes), 1, 16, self.visible_panes)
-        self.active_channels = clamp_int(v.get("active_channels", self.active_channels), 1, 16, self.active_channels)
-        self.window_start = clamp_int(v.get("start", self.window_start), 0, 999, self.window_start)
+        self._load_int_fields(v, _VIEW_INT_FIELDS)
+        self.active_list = active_list_from_assign(v.get("assign", [])) or list(range(1, 17))
 
-        self.active_list = self._active_list_from_assign(v.get("assign", [])) or list(range(1, 17))
-
-        self.cmb_panes.setCurrentText(str(self.visible_panes))
-        self.cmb_active.setCurrentText(str(self.active_channels))
+        # Without firing _on_panes_changed / _on_active_changed: each would
+        # run its own _apply_window before the single pass below.
+        for widget, value in [
+            (self.cmb_panes,   str(self.visible_panes)),
+            (self.cmb_active,  str(self.active_channels)),
+        ]:
+            widget.blockSignals(True)
+            widget.setCurrentText(value)
+            widget.blockSignals(False)
 
         self._rebuild_grid()
         self._clamp_active_list_to_count()
@@ -1190,11 +1518,7 @@ class MainWindow(QMainWindow):
         if not name:
             return
 
-        assign = []
-        for x in self.active_list[:16]:
-            assign.append(x if isinstance(x, int) else None)
-        while len(assign) < 16:
-            assign.append(None)
+        assign = assign_from_active_list(self.active_list)
 
         view_obj = {
             "panes": self.visible_panes,
@@ -1222,11 +1546,7 @@ class MainWindow(QMainWindow):
     # ---------- state ----------
 
     def _state_snapshot(self):
-        assign = []
-        for x in self.active_list[:16]:
-            assign.append(x if isinstance(x, int) else None)
-        while len(assign) < 16:
-            assign.append(None)
+        assign = assign_from_active_list(self.active_list)
         return {
             "panes": self.visible_panes,
             "active_channels": self.active_channels,
@@ -1236,25 +1556,41 @@ class MainWindow(QMainWindow):
             "excluded": sorted(self.excluded),
         }
 
+    def _load_int_fields(self, src: dict, fields):
+        """Copy clamped ints from a view/state dict onto self.  A missing or
+        non-numeric value keeps the attribute's current value."""
+        get = src.get
+        for attr, key, lo, hi in fields:
+            cur = getattr(self, attr)
+            setattr(self, attr, clamp_int(get(key, cur), lo, hi, cur))
+
     def _restore_state(self):
         st = safe_read_json(self.cfg.state_file, None)
         if not isinstance(st, dict):
             return
 
-        self.visible_panes = clamp_int(st.get("panes", self.visible_panes), 1, 16, self.visible_panes)
-        self.active_channels = clamp_int(st.get("active_channels", self.active_channels), 1, 16, self.active_channels)
-        self.window_start = clamp_int(st.get("start", self.window_start), 0, 999, self.window_start)
-        self.focus_idx = clamp_int(st.get("focus_idx", self.focus_idx), 0, 15, self.focus_idx)
-        self.active_list = self._active_list_from_assign(st.get("assign", [])) or self.active_list
+        self._load_int_fields(st, _STATE_INT_FIELDS)
+        self.active_list = active_list_from_assign(st.get("assign", [])) or self.active_list
 
         raw_excl = st.get("excluded", [])
         if isinstance(raw_excl, list):
-            self.excluded = {c for c in raw_excl if isinstance(c, int) and 1 <= c <= 16}
+            self.excluded = {c for c in raw_excl if type(c) is int and c in _VALID_CHANNELS}
         # Strip any excluded channels that crept into active_list
         self.active_list = [c for c in self.active_list if c not in self.excluded]
 
+    def _request_save_state(self):
+        """Restart the 500 ms timer; a burst of changes costs one write."""
+        self._save_state_timer.start()
+
     def _save_state(self):
-        safe_write_json(self.cfg.state_file, self._state_snapshot())
+        # Skip the disk write when nothing changed since the last save.
+        # Serialising is cheap and needs current UI state; the file I/O runs
+        # on the background writer (cleanup() flushes it).
+        blob = json_dumps(self._state_snapshot())
+        if blob == self._last_state_blob:
+            return
+        self._last_state_blob = blob
+        safe_write_bytes_async(self.cfg.state_file, blob)
 
     # ---------- shutdown ----------
 
@@ -1270,21 +1606,25 @@ class MainWindow(QMainWindow):
                 pass
             self.fullscreen = None
 
+        self._save_state_timer.stop()
         try:
             self._save_state()
         except Exception:
             pass
 
-        try:
-            self.state_timer.stop()
-        except Exception:
-            pass
-
         try:
             self.pool.shutdown()
         except Exception:
             pass
 
+        # Let queued stop()/release() calls finish before the instance goes.
+        drained = join_disposal_threads(timeout_total=3.0)
+        flush_json_writes(timeout=3.0)
+        if drained:
+            # Otherwise a worker may still be releasing a player, and with
+            # it a cached Media: leak the cache at exit rather than race it.
+            self.cfg.release_media()
+
         try:
             self.vlc.release()
         except Exception:
@@ -1300,11 +1640,35 @@ def install_sigint_handler(window: MainWindow):
         QTimer.singleShot(0, window.close)
     signal.signal(signal.SIGINT, _sigint)
 
-    tick = QTimer()
-    tick.setInterval(200)
-    tick.timeout.connect(lambda: None)
-    tick.start()
-    return tick
+    # Python only runs signal handlers when the interpreter gets control,
+    # and the Qt loop can sit in C for as long as it's idle.  With a wakeup
+    # fd, the C-level handler writes a byte to the socket pair; the
+    # notifier wakes the loop and its (Python) slot lets _sigint run.  No
+    # periodic wakeups while idle.  socketpair rather than os.pipe because
+    # Windows only accepts sockets here.
+    try:
+        rsock, wsock = socket.socketpair()
+        rsock.setblocking(False)
+        wsock.setblocking(False)
+        signal.set_wakeup_fd(wsock.fileno())
+    except (OSError, ValueError):
+        # Fallback: a no-op tick keeps returning to Python every 200 ms.
+        tick = QTimer()
+        tick.setInterval(200)
+        tick.timeout.connect(lambda: None)
+        tick.start()
+        return tick
+
+    def _drain():
+        try:
+            rsock.recv(4096)
+        except OSError:
+            pass
+
+    notifier = QSocketNotifier(rsock.fileno(), QSocketNotifier.Read)
+    notifier.activated.connect(_drain)
+    notifier._socks = (rsock, wsock)  # keep both ends open
+    return notifier
 
 
 if __name__ == "__main__":
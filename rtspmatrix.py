@@ -10,11 +10,9 @@ import sys
 import os
 import math
 import signal
+import socket
 import logging
-import platform
 import time
-import configparser
-import importlib.metadata
 
 # ---------- platform bootstrap ----------
 
@@ -70,7 +68,7 @@ except OSError as _vlc_err:
         print("  (the full 'vlc' player package also works but is not required)",
               file=sys.stderr)
     raise SystemExit(1) from _vlc_err
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QT_VERSION_STR, PYQT_VERSION_STR
+from PyQt5.QtCore import Qt, QTimer, QSocketNotifier, pyqtSignal, QT_VERSION_STR, PYQT_VERSION_STR
 from PyQt5.QtGui import QGuiApplication, QIcon, QPixmap
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QFrame,
@@ -82,12 +80,18 @@ from PyQt5.QtWidgets import (
 from rtspmatrix_common import (
     log,
     setup_logging,
+    read_ini,
     safe_read_json,
-    safe_write_json,
+    json_dumps,
+    safe_write_bytes_async,
+    safe_write_json_async,
+    flush_json_writes,
     parse_labels,
     dispose_player_async,
     join_disposal_threads,
     bind_player_to_window,
+    vlc_versions,
+    platform_string,
     profiler,
 )
 
@@ -106,14 +110,55 @@ def _load_app_icon():
     return None
 
 
+# ---------- grid shapes ----------
+
+def _compute_grid_dims(n: int, vertical: bool):
+    # integer floor(sqrt(n)) and ceil(n / short): no float round-trips
+    short = max(1, math.isqrt(n))
+    long_ = (n + short - 1) // short
+    return (long_, short) if vertical else (short, long_)
+
+
+# n is clamped to [1, 16], so every (rows, cols) answer is known up front.
+# Index 0 is unused.  See MainWindow._grid_dims.
+_GRID_DIMS_HORIZONTAL = ((0, 0),) + tuple(_compute_grid_dims(n, False) for n in range(1, 17))
+_GRID_DIMS_VERTICAL = ((0, 0),) + tuple(_compute_grid_dims(n, True) for n in range(1, 17))
+
+
+# Channel numbers accepted from state/views JSON.  Paired with a
+# `type(x) is int` test: 3.0 and True hash equal to members but are not channels.
+_VALID_CHANNELS = frozenset(range(1, 17))
+
+# "Pane N: Idle" for pane ids 1..16 (index 0 unused) — the label most
+# often (re)set, so it is formatted once here.
+_PANE_IDLE_TEXT = tuple(f"Pane {i}: Idle" for i in range(17))
+
+# Channel presses on a pane closer together than this are coalesced: the
+# first opens at once, the last one of the burst opens when it settles.
+_PRESS_COALESCE_MS = 150
+
+
 # ---------- config ----------
 
 class RtspConfig:
+    # Fixed attribute set: no per-instance __dict__, faster lookups on the
+    # per-open hot path (url / media_options).
+    __slots__ = (
+        "host", "port", "user", "password", "path",
+        "subtype", "subtype_tile", "subtype_full", "tcp",
+        "network_caching_ms", "open_timeout_ms",
+        "poll_interval_ms", "stall_timeout_ms", "retry_base_ms", "retry_max_ms",
+        "rtsp_timeout_s", "stall_window_s", "disable_hw_decode", "no_audio",
+        "low_latency",
+        "title", "default_panes", "views_file", "state_file",
+        "log_level", "log_file", "stagger_open_ms",
+        "profile", "profile_dump_interval_s", "labels",
+        "media_options", "_urls_tile", "_urls_full",
+        "_channel_texts",
+    )
+
     def __init__(self, ini_path: str = "rtsp.ini"):
-        cp = configparser.RawConfigParser(inline_comment_prefixes=())
-        ok = cp.read(ini_path, encoding="utf-8")
-        if not ok:
-            raise FileNotFoundError(f"Missing config file: {ini_path}")
+        cp = read_ini(ini_path)
 
         s = cp["rtsp"]
         self.host = s.get("host", "127.0.0.1")
@@ -157,6 +202,16 @@ class RtspConfig:
         # if a camera triggers the old symptom.
         self.disable_hw_decode = s.getint("disable_hw_decode", 0) != 0
 
+        # The matrix never plays sound: skip audio output init and audio
+        # decode for every pane.  Set no_audio = 0 to get sound back.
+        self.no_audio = s.getint("no_audio", 1) != 0
+
+        # Live monitoring, not playback: show each frame as soon as it is
+        # decoded instead of re-timing it against the stream clock.  Trims
+        # the extra delay libVLC adds on top of network_caching_ms.  Set
+        # low_latency = 0 if a camera's video plays jerkily.
+        self.low_latency = s.getint("low_latency", 1) != 0
+
         a = cp["app"] if cp.has_section("app") else {}
         self.title = a.get("title", "RTSPMatrix")
         self.default_panes = int(a.get("default_panes", 4))
@@ -178,11 +233,39 @@ class RtspConfig:
 
         raw_labels = cp["view"].get("labels", "") if cp.has_section("view") else ""
         self.labels = parse_labels(raw_labels)
+        # "CH3 Garage" per channel, for the pane labels that are re-set on
+        # every state change.  Index 0 is a placeholder.
+        self._channel_texts = ("",) + tuple(
+            self._format_channel_text(ch) for ch in range(1, 17))
+
+        # Per-media options are identical for every open; build them once.
+        opts = []
+        if self.user:
+            opts.append(f":rtsp-user={self.user}")
+        if self.password:
+            opts.append(f":rtsp-pwd={self.password}")
+        # harden RTSP (TCP interleaving is the instance's --rtsp-tcp)
+        opts.append(":rtsp-keepalive")
+        opts.append(f":rtsp-timeout={self.rtsp_timeout_s}")
+        # jitter buffer and low_latency clocking are instance-wide
+        # (--network-caching / --clock-*); a per-media copy would only be
+        # re-parsed on every open.
+        # macOS HW decode deadlock mitigation
+        if self.disable_hw_decode:
+            opts.append(":avcodec-hw=none")
+        self.media_options = tuple(opts)
+
+        # host/port/path/subtype are fixed after load, so build every URL
+        # once.  Index 0 is a placeholder so the tuples index by channel.
+        base = f"rtsp://{self.host}:{self.port}{self.path}?channel="
+        self._urls_tile = ("",) + tuple(
+            f"{base}{ch}&subtype={self.subtype_tile}" for ch in range(1, 17))
+        self._urls_full = ("",) + tuple(
+            f"{base}{ch}&subtype={self.subtype_full}" for ch in range(1, 17))
 
     def url(self, channel: int, hd: bool = False) -> str:
         ch = max(1, min(16, int(channel)))
-        sub = self.subtype_full if hd else self.subtype_tile
-        return f"rtsp://{self.host}:{self.port}{self.path}?channel={ch}&subtype={sub}"
+        return (self._urls_full if hd else self._urls_tile)[ch]
 
     def label_for(self, ch):
         try:
@@ -198,6 +281,11 @@ class RtspConfig:
         return lbl is not None and lbl != "BRAK"
 
     def channel_text(self, ch) -> str:
+        if type(ch) is int and 1 <= ch <= 16:
+            return self._channel_texts[ch]
+        return self._format_channel_text(ch)
+
+    def _format_channel_text(self, ch) -> str:
         lbl = self.label_for(ch)
         if lbl and lbl != "BRAK":
             return f"CH{int(ch)} {lbl}"
@@ -212,9 +300,13 @@ class ViewsStore:
         self.data = safe_read_json(self.path, {"views": {}})
         if "views" not in self.data or not isinstance(self.data["views"], dict):
             self.data = {"views": {}}
+        self._names = None
 
     def list_names(self):
-        return sorted(self.data["views"].keys(), key=str.lower)
+        # Sorted once per change of the name set, not on every combo reload.
+        if self._names is None:
+            self._names = tuple(sorted(self.data["views"].keys(), key=str.lower))
+        return self._names
 
     def get(self, name: str):
         return self.data["views"].get(name)
@@ -222,13 +314,24 @@ class ViewsStore:
     def save(self, name: str, panes: int, assign: list):
         panes = int(max(1, min(16, panes)))
         assign = (assign or [])[:16]
+        if name not in self.data["views"]:
+            self._names = None
         self.data["views"][name] = {"panes": panes, "assign": assign}
-        safe_write_json(self.path, self.data)
+        self._write()
 
     def delete(self, name: str):
         if name in self.data["views"]:
             del self.data["views"][name]
-            safe_write_json(self.path, self.data)
+            self._names = None
+            self._write()
+
+    def _write(self):
+        # Written off the GUI thread.  View entries are replaced, never
+        # mutated in place, so a shallow copy of the mapping is a stable
+        # snapshot for the writer.
+        snapshot = dict(self.data)
+        snapshot["views"] = dict(self.data["views"])
+        safe_write_json_async(self.path, snapshot)
 
 
 # ---------- UI ----------
@@ -267,6 +370,10 @@ class PlayerPane(QWidget):
         to escape broken live555 state
     """
 
+    # Frame stylesheets, built once; set_focused swaps between them.
+    _STYLE_IDLE = "background: black; border: 3px solid #333;"
+    _STYLE_FOCUSED = "background: black; border: 3px solid #66aaff;"
+
     # libVLC events fire on libVLC's internal threads.  Emitting a Qt signal
     # marshals the call back to the GUI thread via a queued connection.  The
     # int is the player generation: events from a swapped-out player carry an
@@ -286,7 +393,8 @@ class PlayerPane(QWidget):
 
         self.frame = ClickableFrame(self)
         self.frame.setFrameShape(QFrame.Box)
-        self.frame.setStyleSheet("background: black; border: 3px solid #333;")
+        self.frame.setStyleSheet(self._STYLE_IDLE)
+        self._focused = False
         self.frame.setMinimumSize(240, 160)
         self.frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         # Force a real OS-level window handle independent of the parent
@@ -296,7 +404,9 @@ class PlayerPane(QWidget):
         self.frame.clicked.connect(self._clicked)
         self.frame.doubleClicked.connect(self._dblclicked)
 
-        self.label = QLabel(f"Pane {pane_id}: Idle", self)
+        self.label = QLabel(_PANE_IDLE_TEXT[pane_id], self)
+        # Last text given to self.label; see _set_label.
+        self._label_text = _PANE_IDLE_TEXT[pane_id]
         self.label.setStyleSheet("color: #ddd;")
         self.label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
 
@@ -307,13 +417,21 @@ class PlayerPane(QWidget):
         l.addWidget(self.label, 0)
 
         self.player = None
+        # Native handle of self.frame, read on first bind.  It only changes
+        # when the pane is reparented, and that path goes through
+        # _detach_player_window, which clears it.
+        self._frame_wid = 0
+        # True while self.player has never had media set.  Such a player
+        # carries no live555 state, so _swap_player can reuse it instead of
+        # allocating (and async-disposing) yet another one.
+        self._player_fresh = False
         self.assigned_channel = None
+        # Channel whose open was deferred until the pane is first shown.
+        self._pending_channel = None
 
         # retry/stall tracking
         self._retry_attempt = 0
         self._retry_pending = False
-        self._opening_since_ts = 0.0
-        self._last_progress_ts = 0.0
         self._is_playing = False
         self._player_gen = 0
         # Timestamp of the most recent _start_play; cleared on first
@@ -329,13 +447,14 @@ class PlayerPane(QWidget):
         self._prev_pulse_decoded = 0
         self._prev_pulse_lost = 0
 
-        self.open_timer = QTimer(self)
-        self.open_timer.setSingleShot(True)
-        self.open_timer.timeout.connect(self._open_timeout)
-
-        self.retry_timer = QTimer(self)
-        self.retry_timer.setSingleShot(True)
-        self.retry_timer.timeout.connect(self._retry_now)
+        # One single-shot watchdog per pane covers both waits, which never
+        # overlap: "open" (open_timeout_ms after _start_play) and "retry"
+        # (backoff delay before the next attempt).  Arming one phase
+        # replaces the other.
+        self._watch_phase = None
+        self._watch_timer = QTimer(self)
+        self._watch_timer.setSingleShot(True)
+        self._watch_timer.timeout.connect(self._on_watchdog)
 
         # Queued connection (default for cross-thread emit) is what makes
         # the libVLC-thread -> GUI-thread handoff safe.
@@ -357,7 +476,29 @@ class PlayerPane(QWidget):
         self._last_fps = 0.0
         self._last_lost = 0
 
-        QTimer.singleShot(0, self._ensure_player)
+        # No player is created up front: a libVLC MediaPlayer (and its
+        # native-window binding) only exists once the pane opens a channel,
+        # so panes that stay hidden or idle cost no libVLC handles.
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_channel is not None:
+            # Open from the event loop rather than inside show(), so the
+            # window gets its first paint before libVLC builds a pipeline.
+            QTimer.singleShot(0, self._open_pending)
+
+    def _open_pending(self):
+        ch = self._pending_channel
+        if ch is None or not self.isVisible():
+            return
+        self._pending_channel = None
+        if self.assigned_channel == ch:
+            # The deferred open replaces whatever the player last did, so
+            # play_channel's "already playing / opening" early-returns
+            # must not swallow it.
+            self._is_playing = False
+            self._disarm_watchdog()
+            self.play_channel(ch)
 
     def _clicked(self):
         self.on_focus(self.pane_id)
@@ -366,19 +507,30 @@ class PlayerPane(QWidget):
         if self.on_dblclick is not None:
             self.on_dblclick(self.pane_id)
 
+    def _set_label(self, text: str):
+        # libVLC sends "buffering" over and over while a stream opens; only
+        # hand the label a string (and a relayout) when it actually changes.
+        if text != self._label_text:
+            self._label_text = text
+            self.label.setText(text)
+
     def set_focused(self, focused: bool):
-        if focused:
-            self.frame.setStyleSheet("background: black; border: 3px solid #66aaff;")
-        else:
-            self.frame.setStyleSheet("background: black; border: 3px solid #333;")
+        # setStyleSheet forces a style recompute + repaint; skip no-ops.
+        if focused == self._focused:
+            return
+        self._focused = focused
+        self.frame.setStyleSheet(self._STYLE_FOCUSED if focused else self._STYLE_IDLE)
 
     def _bind_player_window(self, player: vlc.MediaPlayer):
-        bind_player_to_window(player, int(self.frame.winId()))
+        if not self._frame_wid:
+            self._frame_wid = int(self.frame.winId())
+        bind_player_to_window(player, self._frame_wid)
 
     def _detach_player_window(self):
         """Tell libVLC to stop drawing into our QFrame, but keep the player
         alive.  Used during grid rebuilds, where the QFrame's native window
         handle is about to be invalidated by reparenting."""
+        self._frame_wid = 0
         if self.player is None:
             return
         try:
@@ -450,41 +602,71 @@ class PlayerPane(QWidget):
     def _ensure_player(self):
         if self.player is None:
             self.player = self._new_player()
+            self._player_fresh = True
 
     def _swap_player(self) -> vlc.MediaPlayer:
+        """Return a player that has never opened a stream.  A fresh idle
+        player is reused as-is; one that has already been given media is
+        replaced (never reused after an open attempt — see module header)."""
+        if self.player is not None and self._player_fresh:
+            self._player_fresh = False
+            # The idle player may have been bound before the frame got its
+            # final native handle (grid insertion); bind again, it's cheap.
+            self._bind_player_window(self.player)
+            profiler.count("player_reuse_fresh")
+            return self.player
         old = self.player
         self.player = self._new_player()
+        self._player_fresh = False
         if old is not None:
             dispose_player_async(old)
             profiler.count("player_swap")
         return self.player
 
+    def _arm_watchdog(self, phase: str, ms: int):
+        self._watch_phase = phase
+        self._watch_timer.start(ms)
+
+    def _disarm_watchdog(self, phase=None):
+        """Stop the watchdog; with `phase`, only if that phase is armed."""
+        if phase is not None and self._watch_phase != phase:
+            return
+        self._watch_phase = None
+        if self._watch_timer.isActive():
+            self._watch_timer.stop()
+
+    def _on_watchdog(self):
+        phase = self._watch_phase
+        self._watch_phase = None
+        if phase == "open":
+            self._open_timeout()
+        elif phase == "retry":
+            self._retry_now()
+
     def _cancel_retry(self):
         self._retry_pending = False
-        if self.retry_timer.isActive():
-            self.retry_timer.stop()
+        self._disarm_watchdog("retry")
 
     def stop_to_idle(self, keep_channel=False):
         self._cancel_retry()
-        if self.open_timer.isActive():
-            self.open_timer.stop()
+        self._disarm_watchdog()
+        self._pending_channel = None
         self._throughput_window.clear()
         self._prev_pulse_tec = 0
         self._prev_pulse_decoded = 0
         self._prev_pulse_lost = 0
-        if self.player is not None:
+        # A fresh player never opened anything — keep it for the next open.
+        if self.player is not None and not self._player_fresh:
             dispose_player_async(self.player)
             self.player = None  # _ensure_player will lazily recreate it
         self._retry_attempt = 0
-        self._opening_since_ts = 0.0
-        self._last_progress_ts = 0.0
         self._is_playing = False
         if keep_channel and self.assigned_channel is not None:
-            self.label.setText(
+            self._set_label(
                 f"Pane {self.pane_id}: {self.cfg.channel_text(self.assigned_channel)} (hidden)")
         else:
             self.assigned_channel = None
-            self.label.setText(f"Pane {self.pane_id}: Idle")
+            self._set_label(_PANE_IDLE_TEXT[self.pane_id])
 
     def play_channel(self, ch: int):
         ch = int(max(1, min(16, ch)))
@@ -498,15 +680,31 @@ class PlayerPane(QWidget):
         # start over" cycle on every double-press of a channel button.
         if self.assigned_channel == ch and self.player is not None and self._is_playing:
             return
+        # Same for an open of this channel that is still in flight: the
+        # "open" watchdog already covers it if it never gets to playing.
+        if (self.assigned_channel == ch and self.player is not None
+                and self._watch_phase == "open" and self._watch_timer.isActive()):
+            return
+
+        # Not on screen yet (startup, or hidden behind a fullscreen pane):
+        # binding a player now would force the frame's native window into
+        # existence before it is mapped.  showEvent opens it instead.
+        if not self.isVisible():
+            self._cancel_retry()
+            self.assigned_channel = ch
+            if self.player is not None and not self._player_fresh:
+                # Don't leave the previous channel streaming under the new
+                # channel's label while the pane waits to be shown.
+                self.stop_to_idle(keep_channel=True)
+            self._pending_channel = ch
+            return
+        self._pending_channel = None
 
         self._ensure_player()
         self._cancel_retry()
         self._retry_attempt = 0
 
         self.assigned_channel = ch
-        now = time.monotonic()
-        self._opening_since_ts = now
-        self._last_progress_ts = 0.0
         self._is_playing = False
 
         self._start_play(ch, reason="play")
@@ -517,24 +715,8 @@ class PlayerPane(QWidget):
 
             url = self.cfg.url(ch)
             media = self.vlc.media_new(url)
-
-            if self.cfg.user:
-                media.add_option(f":rtsp-user={self.cfg.user}")
-            if self.cfg.password:
-                media.add_option(f":rtsp-pwd={self.cfg.password}")
-
-            # harden RTSP
-            if self.cfg.tcp:
-                media.add_option(":rtsp-tcp")
-            media.add_option(":rtsp-keepalive")
-            media.add_option(f":rtsp-timeout={self.cfg.rtsp_timeout_s}")
-
-            # jitter buffer
-            media.add_option(f":network-caching={self.cfg.network_caching_ms}")
-
-            # macOS HW decode deadlock mitigation
-            if self.cfg.disable_hw_decode:
-                media.add_option(":avcodec-hw=none")
+            for opt in self.cfg.media_options:
+                media.add_option(opt)
 
             p.set_media(media)
             try:
@@ -551,8 +733,8 @@ class PlayerPane(QWidget):
 
             log.info("pane %d: opening CH%d (%s) url=%s",
                      self.pane_id, ch, reason, url)
-            self.label.setText(f"Pane {self.pane_id}: Opening {self.cfg.channel_text(ch)} ({reason})")
-            self.open_timer.start(self.cfg.open_timeout_ms)
+            self._set_label(f"Pane {self.pane_id}: Opening {self.cfg.channel_text(ch)} ({reason})")
+            self._arm_watchdog("open", self.cfg.open_timeout_ms)
 
     def _schedule_retry(self, why: str):
         if self._retry_pending or self.assigned_channel is None:
@@ -564,17 +746,16 @@ class PlayerPane(QWidget):
 
         delay = min(self.cfg.retry_max_ms, self.cfg.retry_base_ms * (2 ** max(0, self._retry_attempt - 1)))
         ch = self.assigned_channel
-        self.label.setText(f"Pane {self.pane_id}: {self.cfg.channel_text(ch)} lost ({why}), retry in {delay}ms")
+        self._set_label(f"Pane {self.pane_id}: {self.cfg.channel_text(ch)} lost ({why}), retry in {delay}ms")
         log.warning("pane %d: CH%d retry#%d in %dms (%s)",
                     self.pane_id, ch, self._retry_attempt, delay, why)
-        self.retry_timer.start(delay)
+        self._arm_watchdog("retry", delay)
 
     def _retry_now(self):
         self._retry_pending = False
         if self.assigned_channel is None:
             return
         ch = self.assigned_channel
-        self._opening_since_ts = time.monotonic()
         self._start_play(ch, reason=f"retry#{self._retry_attempt}")
 
     def _on_state_event(self, name: str, gen: int):
@@ -586,7 +767,6 @@ class PlayerPane(QWidget):
             return
 
         ch = self.assigned_channel
-        now = time.monotonic()
 
         if name == "playing":
             # Time-to-first-frame: elapsed from _start_play to "playing".
@@ -595,17 +775,13 @@ class PlayerPane(QWidget):
                 profiler.record("time_to_first_frame_ms", ttff_ms)
                 self._play_started_ts = 0.0
             self._is_playing = True
-            self._last_progress_ts = now
-            self._opening_since_ts = 0.0
             self._retry_attempt = 0
-            if self.open_timer.isActive():
-                self.open_timer.stop()
-            self.label.setText(f"Pane {self.pane_id}: {self.cfg.channel_text(ch)} playing")
+            self._disarm_watchdog("open")
+            self._set_label(f"Pane {self.pane_id}: {self.cfg.channel_text(ch)} playing")
             return
 
         if name == "time":
             # Forward-progress heartbeat — fires whenever the player advances.
-            self._last_progress_ts = now
             self._time_event_count += 1
             # Time events implicitly mean the player is playing.  Treat as
             # a safety net in case a transient paused/stopped event
@@ -615,7 +791,7 @@ class PlayerPane(QWidget):
             return
 
         if name in ("opening", "buffering"):
-            self.label.setText(f"Pane {self.pane_id}: {self.cfg.channel_text(ch)} {name}")
+            self._set_label(f"Pane {self.pane_id}: {self.cfg.channel_text(ch)} {name}")
             return
 
         if name in ("error", "ended", "stopped"):
@@ -800,8 +976,7 @@ class PlayerPane(QWidget):
 
     def shutdown(self):
         self._cancel_retry()
-        if self.open_timer.isActive():
-            self.open_timer.stop()
+        self._disarm_watchdog()
         if self.player is not None:
             dispose_player_async(self.player)
             self.player = None
@@ -876,18 +1051,9 @@ class AboutDialog(QDialog):
         py_ver = sys.version.split()[0]
         qt_ver = QT_VERSION_STR
         pyqt_ver = PYQT_VERSION_STR
-        try:
-            pv_vlc = importlib.metadata.version("python-vlc")
-        except Exception:
-            pv_vlc = "?"
-        try:
-            libvlc_ver = vlc.libvlc_get_version()
-            if isinstance(libvlc_ver, bytes):
-                libvlc_ver = libvlc_ver.decode("utf-8", errors="ignore")
-            else:
-                libvlc_ver = str(libvlc_ver)
-        except Exception:
-            libvlc_ver = "?"
+        pv_vlc, libvlc_ver = vlc_versions()
+        pv_vlc = pv_vlc or "?"
+        libvlc_ver = libvlc_ver or "?"
 
         hw = "ON" if not cfg.disable_hw_decode else "OFF (software)"
         sub_tile = cfg.subtype_tile
@@ -901,7 +1067,7 @@ class AboutDialog(QDialog):
 
         html = "<table cellspacing='0' style='font-size:12px; font-family:monospace;'>"
         html += "<tr><td colspan='2' style='padding:4px 0 2px; color:#66aaff; font-weight:bold;'>System</td></tr>"
-        html += row("OS", platform.platform())
+        html += row("OS", platform_string())
         html += row("Python", py_ver)
         html += row("Qt / PyQt5", f"{qt_ver} / {pyqt_ver}")
         html += row("libVLC", libvlc_ver)
@@ -912,6 +1078,8 @@ class AboutDialog(QDialog):
         html += row("Path", cfg.path)
         html += row("Transport", "TCP" if cfg.tcp else "UDP")
         html += row("HW decode", hw)
+        html += row("Audio", "OFF" if cfg.no_audio else "ON")
+        html += row("Low latency", "ON" if cfg.low_latency else "OFF")
         html += row("Subtype (tile / full)", f"{sub_tile} / {sub_full}")
         html += row("Network cache", f"{cfg.network_caching_ms} ms")
         html += row("Open timeout", f"{cfg.open_timeout_ms} ms")
@@ -939,7 +1107,7 @@ class AboutDialog(QDialog):
         # Plain-text version for clipboard
         self._plain = "\n".join([
             f"{cfg.title}",
-            f"OS: {platform.platform()}",
+            f"OS: {platform_string()}",
             f"Python: {py_ver}  Qt: {qt_ver}  PyQt5: {pyqt_ver}",
             f"libVLC: {libvlc_ver}  python-vlc: {pv_vlc}",
             f"RTSP: {cfg.host}:{cfg.port}{cfg.path}  TCP={cfg.tcp}  HW={hw}",
@@ -979,6 +1147,12 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self._cleaned = False
+        self._last_state_blob = None
+        self._views_names = None
+        # Build the whole widget tree with painting frozen; every child
+        # inherits this, so adding 16 buttons + 16 tiles doesn't trigger a
+        # cascade of intermediate repaints.  Re-enabled at the end.
+        self.setUpdatesEnabled(False)
 
         self.cfg = RtspConfig("rtsp.ini")
         self.views = ViewsStore(self.cfg.views_file)
@@ -988,12 +1162,20 @@ class MainWindow(QMainWindow):
             "--verbose=0",
             "--no-video-title-show",
             "--sub-source=marq",
+            # No OSD or Lua extensions.  Stats and SPU stay on: the overlay
+            # reads MediaStats and the marquee is drawn as a subpicture.
+            "--no-osd",
+            "--no-lua",
         ]
         if self.cfg.tcp:
             vlc_args.append("--rtsp-tcp")
         vlc_args.append(f"--network-caching={self.cfg.network_caching_ms}")
+        if self.cfg.low_latency:
+            vlc_args += ["--clock-jitter=0", "--clock-synchro=0"]
         if self.cfg.disable_hw_decode:
             vlc_args.append("--avcodec-hw=none")
+        if self.cfg.no_audio:
+            vlc_args.append("--no-audio")
         self.vlc = vlc.Instance(vlc_args)
 
         self.setWindowTitle(self.cfg.title)
@@ -1070,6 +1252,7 @@ class MainWindow(QMainWindow):
         main.addWidget(self._controls_panel)
 
         self.info = QLabel("Active pane: 1", self)
+        self._last_info = "Active pane: 1"
         self.info.setStyleSheet("color: #ddd;")
         main.addWidget(self.info)
 
@@ -1090,6 +1273,15 @@ class MainWindow(QMainWindow):
         self._save_state_timer.setInterval(500)
         self._save_state_timer.timeout.connect(self._save_state)
 
+        # Trailing open for a burst of channel presses (pane_id, channel);
+        # see on_channel_pressed.
+        self._press_pending = None
+        self._press_last_t = 0.0
+        self._press_timer = QTimer(self)
+        self._press_timer.setSingleShot(True)
+        self._press_timer.setInterval(_PRESS_COALESCE_MS)
+        self._press_timer.timeout.connect(self._flush_channel_press)
+
         # Profiler plumbing: a periodic dump timer + a tight event-loop
         # tick that measures scheduling jitter (if the jitter spikes,
         # something is blocking the GUI thread).  Both short-circuit on
@@ -1117,6 +1309,15 @@ class MainWindow(QMainWindow):
                       for pid in range(1, 17)]
         self.grid_rows = 0
         self.grid_cols = 0
+        # (n, rows, cols) the grid was last built for; _rebuild_grid is a
+        # no-op when asked to rebuild the exact same layout.
+        self._grid_key = None
+        # Grid cell each pane currently occupies (None = hidden, out of the
+        # layout; () = not placed yet), so a rebuild only moves the panes
+        # whose cell actually changes.
+        self._pane_cells = [()] * 16
+        # (rows, cols) the grid stretches were last set for.
+        self._stretch_dims = (0, 0)
 
         # Fullscreen is done in-place: the main window goes fullscreen, the
         # toolbar/controls hide, every other pane hides, and row/col
@@ -1160,21 +1361,27 @@ class MainWindow(QMainWindow):
         self._update_orient_button()
         self._apply_panes_visibility(target_panes)
         self._update_focus()
+        self.setUpdatesEnabled(True)
 
     def _reload_views_combo(self):
+        # Overwriting an existing view leaves the name list as it was;
+        # don't reset the combo's model for nothing.
         names = self.views.list_names()
+        if names == self._views_names:
+            return
+        self._views_names = names
+        self.cmb_views.blockSignals(True)
         self.cmb_views.clear()
-        self.cmb_views.addItem("")
-        for n in names:
-            self.cmb_views.addItem(n)
+        self.cmb_views.addItems([""] + list(names))
+        self.cmb_views.blockSignals(False)
 
     def _state_snapshot(self):
-        assign = [p.assigned_channel for p in self.panes]
         return {
             "panes": self.visible_panes,
             "active_pane": self.active_pane,
             "split_orientation": self.split_orientation,
-            "assign": assign[:16],
+            # self.panes is always exactly 16 long
+            "assign": [p.assigned_channel for p in self.panes],
         }
 
     def _restore_state(self):
@@ -1192,17 +1399,24 @@ class MainWindow(QMainWindow):
         if orient in ("horizontal", "vertical"):
             self.split_orientation = orient
         if isinstance(assign, list):
-            for i in range(min(16, len(assign))):
-                ch = assign[i]
-                if isinstance(ch, int) and 1 <= ch <= 16 and self.cfg.is_channel_active(ch):
-                    self.panes[i].assigned_channel = ch
-                    self.panes[i].label.setText(f"Pane {i+1}: {self.cfg.channel_text(ch)} (saved)")
+            cfg = self.cfg
+            for p, ch in zip(self.panes, assign[:16]):
+                if type(ch) is int and ch in _VALID_CHANNELS and cfg.is_channel_active(ch):
+                    p.assigned_channel = ch
+                    p._set_label(f"Pane {p.pane_id}: {cfg.channel_text(ch)} (saved)")
                 else:
-                    self.panes[i].assigned_channel = None
-                    self.panes[i].label.setText(f"Pane {i+1}: Idle")
+                    p.assigned_channel = None
+                    p._set_label(_PANE_IDLE_TEXT[p.pane_id])
 
     def _save_state(self):
-        safe_write_json(self.cfg.state_file, self._state_snapshot())
+        # Skip the disk write when nothing changed since the last save.
+        # Serialising is cheap and needs current UI state; the file I/O runs
+        # on the background writer (cleanup() flushes it).
+        blob = json_dumps(self._state_snapshot())
+        if blob == self._last_state_blob:
+            return
+        self._last_state_blob = blob
+        safe_write_bytes_async(self.cfg.state_file, blob)
 
     def _request_save_state(self):
         """Debounced state save.  Restarts the 500 ms timer on every call
@@ -1214,6 +1428,13 @@ class MainWindow(QMainWindow):
             p.set_focused(p.pane_id == self.active_pane and p.isVisible())
         self._update_aggregate_stats()
 
+    def _set_info(self, text: str):
+        # The status line is rebuilt every second and on every focus change;
+        # only touch the QLabel (and schedule a repaint) when it differs.
+        if text != self._last_info:
+            self._last_info = text
+            self.info.setText(text)
+
     def _tick_stats(self):
         """Shared 1 Hz stats tick: sample every pane's libVLC stats first,
         then rebuild the aggregate status bar from the cached values."""
@@ -1244,7 +1465,7 @@ class MainWindow(QMainWindow):
         ]
         if total_lost > 0:
             pieces.append(f"lost: {total_lost}")
-        self.info.setText("  |  ".join(pieces))
+        self._set_info("  |  ".join(pieces))
 
         # Feed gauges to the profiler (cheap no-op when disabled).
         profiler.gauge("visible_panes", len(visible))
@@ -1282,8 +1503,15 @@ class MainWindow(QMainWindow):
             pane_id = 1
         if self.active_pane == pane_id:
             return
+        prev = self.active_pane
         self.active_pane = pane_id
-        self._update_focus()
+        # Only the old and new pane change; the full sweep in _update_focus
+        # is for layout/visibility changes.
+        if 1 <= prev <= 16:
+            self.panes[prev - 1].set_focused(False)
+        p = self.panes[pane_id - 1]
+        p.set_focused(p.isVisible())
+        self._update_aggregate_stats()
         self._request_save_state()
 
     # ---------- fullscreen ----------
@@ -1406,26 +1634,20 @@ class MainWindow(QMainWindow):
         n = max(1, min(16, int(n)))
         orient = getattr(self, "split_orientation", "horizontal")
         if orient == "vertical":
-            cols = max(1, int(math.floor(math.sqrt(n))))
-            rows = int(math.ceil(n / cols))
-        else:
-            rows = max(1, int(math.floor(math.sqrt(n))))
-            cols = int(math.ceil(n / rows))
-        return rows, cols
-
-    def _clear_pane_layout(self):
-        while self.panes_grid.count():
-            item = self.panes_grid.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.setParent(None)
+            return _GRID_DIMS_VERTICAL[n]
+        return _GRID_DIMS_HORIZONTAL[n]
 
     def _rebuild_grid(self):
         """Re-populate self.panes_grid for self.visible_panes tiles, computing
-        rows/cols dynamically.  Reparenting a QFrame invalidates its native
-        window handle, so for every pane that *currently* has a player we:
+        rows/cols dynamically.  Panes are moved between cells in place
+        (removeWidget + addWidget keeps the Qt parent), so their native
+        window handles survive and live players are not touched.
+
+        The exception is a pane's first insertion: panes are created
+        parentless, and reparenting a QFrame invalidates its native window
+        handle.  For those panes we:
           1. detach the live player from the (about-to-die) winId,
-          2. re-add the pane at its new (r, c),
+          2. add the pane at its (r, c),
           3. force Qt to allocate a fresh native window handle,
           4. rebind the player to that handle.
         Players keep playing throughout — no reconnect, no media reload."""
@@ -1434,48 +1656,63 @@ class MainWindow(QMainWindow):
 
     def _rebuild_grid_impl(self):
         n = self.visible_panes
+        rows, cols = self._grid_dims(n) if n > 0 else (0, 0)
+        key = (n, rows, cols)
+        if key == self._grid_key:
+            return
+        self._grid_key = key
 
-        # Detach EVERY pane that has a player, not just the soon-to-be-visible
-        # ones: stop_to_idle leaves a fresh idle player behind, and even those
-        # are bound to the about-to-die frame winId.
-        for p in self.panes:
+        host = self.centralWidget()
+        reparented = [p for p in self.panes[:n] if p.parentWidget() is not host]
+        for p in reparented:
             p._detach_player_window()
 
-        self._clear_pane_layout()
-
-        rows, cols = self._grid_dims(n) if n > 0 else (0, 0)
         self.grid_rows, self.grid_cols = rows, cols
 
-        for i in range(16):
-            self.panes[i].setVisible(i < n)
-
-        for i in range(n):
-            r = i // cols
-            c = i % cols
-            self.panes_grid.addWidget(self.panes[i], r, c)
-
-        # Reset stretches and apply only to the active rows/cols.
-        for k in range(16):
-            self.panes_grid.setRowStretch(k, 0)
-            self.panes_grid.setColumnStretch(k, 0)
-        for r in range(rows):
-            self.panes_grid.setRowStretch(r, 1)
-        for c in range(cols):
-            self.panes_grid.setColumnStretch(c, 1)
+        # Freeze painting while panes move and stretches change, so Qt
+        # repaints the grid once at the end instead of after every step.
+        host.setUpdatesEnabled(False)
+        try:
+            cells = self._pane_cells
+            for i, p in enumerate(self.panes):
+                cell = divmod(i, cols) if i < n else None
+                if cell == cells[i] and p not in reparented:
+                    continue
+                if cells[i]:
+                    self.panes_grid.removeWidget(p)
+                if cell is not None:
+                    self.panes_grid.addWidget(p, *cell)
+                p.setVisible(cell is not None)
+                cells[i] = cell
+
+            # Stretch 1 on the active rows/cols, 0 beyond.  Only the rows and
+            # columns between the old and new size change, so only those are
+            # set (fullscreen restores its own changes on exit).
+            old_rows, old_cols = self._stretch_dims
+            self._stretch_dims = (rows, cols)
+            for r in range(min(rows, old_rows), max(rows, old_rows)):
+                self.panes_grid.setRowStretch(r, 1 if r < rows else 0)
+            for c in range(min(cols, old_cols), max(cols, old_cols)):
+                self.panes_grid.setColumnStretch(c, 1 if c < cols else 0)
+        finally:
+            host.setUpdatesEnabled(True)
+
+        if not reparented:
+            return
 
         # Force Qt to allocate fresh native window handles before we rebind.
-        for i in range(n):
-            _ = int(self.panes[i].frame.winId())
+        for p in reparented:
+            _ = int(p.frame.winId())
         QApplication.processEvents()
 
-        for i in range(n):
-            self.panes[i].rebind_to_current_frame()
+        for p in reparented:
+            p.rebind_to_current_frame()
 
-    def _apply_panes_visibility(self, n: int):
+    def _apply_panes_visibility(self, n: int, extra=()):
         with profiler.time("apply_panes_visibility"):
-            self._apply_panes_visibility_impl(n)
+            self._apply_panes_visibility_impl(n, extra)
 
-    def _apply_panes_visibility_impl(self, n: int):
+    def _apply_panes_visibility_impl(self, n: int, extra=()):
         n = max(1, min(16, int(n)))
         prev = self.visible_panes
         self.visible_panes = n
@@ -1493,8 +1730,10 @@ class MainWindow(QMainWindow):
         self._rebuild_grid()
 
         # (Re)start saved channels for panes that just became visible — the
-        # previous behaviour silently left them stuck in "(saved)".
-        batch = []
+        # previous behaviour silently left them stuck in "(saved)".  `extra`
+        # (pane_id, channel) pairs ride in the same stagger queue, so the
+        # caller's opens don't race a second batch.
+        batch = list(extra)
         for i in range(prev, n):
             ch = self.panes[i].assigned_channel
             if isinstance(ch, int) and self.cfg.is_channel_active(ch):
@@ -1555,7 +1794,7 @@ class MainWindow(QMainWindow):
                 continue
 
             delay = idx * step
-            pane.label.setText(
+            pane._set_label(
                 f"Pane {pane_id}: {self.cfg.channel_text(ch)} (queued, +{delay}ms)")
 
             def _go(pid=pane_id, target_ch=ch):
@@ -1568,10 +1807,39 @@ class MainWindow(QMainWindow):
 
     def on_channel_pressed(self, ch: int):
         log.info("user: assign CH%d -> pane %d", ch, self.active_pane)
+        now = time.monotonic()
+        burst = (now - self._press_last_t) * 1000.0 < _PRESS_COALESCE_MS
+        self._press_last_t = now
+        pending = self._press_pending
+        if pending is not None and pending[0] != self.active_pane:
+            # The burst moved to another pane; the last press on the old
+            # one still wins there.
+            self._flush_channel_press()
+        if burst:
+            # Tapping through channels: each press would build and tear
+            # down a player.  Only the one the user stops on is opened.
+            self._press_pending = (self.active_pane, ch)
+            self._press_timer.start()
+            return
+        self._cancel_channel_press()
         self.panes[self.active_pane - 1].play_channel(ch)
         self._request_save_state()
 
+    def _flush_channel_press(self):
+        pending = self._press_pending
+        self._cancel_channel_press()
+        if pending is None or self._cleaned:
+            return
+        pane_id, ch = pending
+        self.panes[pane_id - 1].play_channel(ch)
+        self._request_save_state()
+
+    def _cancel_channel_press(self):
+        self._press_timer.stop()
+        self._press_pending = None
+
     def clear_active_pane(self):
+        self._cancel_channel_press()
         self.panes[self.active_pane - 1].stop_to_idle()
         self._request_save_state()
 
@@ -1583,36 +1851,47 @@ class MainWindow(QMainWindow):
         if not isinstance(v, dict):
             return
         log.info("user: apply view %r", name)
+        self._cancel_channel_press()
         panes = int(v.get("panes", 4))
         assign = v.get("assign", [])
 
         # Pre-set every pane's assigned_channel and idle the ones the view
         # leaves empty.  _apply_panes_visibility will then read those
         # assignments through its own staggered-open path.
-        for i in range(1, 17):
-            p = self.panes[i - 1]
-            ch = assign[i - 1] if i - 1 < len(assign) else None
-            if isinstance(ch, int) and 1 <= ch <= 16 and i <= panes:
-                p.assigned_channel = ch
-            elif i > panes:
-                # out of range for the new pane count; keep state but skip
-                pass
+        # Panes past the new count keep their state untouched.
+        # Diff against what is on screen: a visible pane already playing its
+        # view channel is left alone, one switching channel drops its old
+        # session first (otherwise play_channel's idempotence check would
+        # see the pre-set channel and keep the old stream on screen).
+        prev = self.visible_panes
+        n_assign = len(assign)
+        reopen = []
+        for i, p in enumerate(self.panes[:max(0, min(16, panes))]):
+            ch = assign[i] if i < n_assign else None
+            if type(ch) is int and ch in _VALID_CHANNELS:
+                if p.assigned_channel != ch:
+                    if p.player is not None:
+                        p.stop_to_idle(keep_channel=True)
+                    p.assigned_channel = ch
+                elif p._is_playing:
+                    continue
+                if i < prev and self.cfg.is_channel_active(ch):
+                    reopen.append((i + 1, ch))
             else:
                 p.stop_to_idle()
 
+        # Silently: _on_panes_changed would run _apply_panes_visibility
+        # here and the else-branch below would run it again.
+        self.cmb_panes.blockSignals(True)
         self.cmb_panes.setCurrentText(str(panes))
-        # When the pane count is the same as before, _apply_panes_visibility
-        # does NOT iterate the "newly revealed" range.  Force a re-open of
-        # visible panes in that case by going through the stagger helper.
-        if self.visible_panes == panes:
-            batch = [(i, self.panes[i - 1].assigned_channel)
-                     for i in range(1, panes + 1)
-                     if isinstance(self.panes[i - 1].assigned_channel, int)
-                     and self.cfg.is_channel_active(self.panes[i - 1].assigned_channel)]
-            if batch:
-                self._play_batch_staggered(batch)
-        else:
-            self._apply_panes_visibility(panes)
+        self.cmb_panes.blockSignals(False)
+        # _apply_panes_visibility only opens the "newly revealed" range, so
+        # panes that were already visible and changed (or are not playing)
+        # are handed to it as extra items: one stagger queue for both.
+        if self.visible_panes != panes:
+            self._apply_panes_visibility(panes, reopen)
+        elif reopen:
+            self._play_batch_staggered(reopen)
 
         self._request_save_state()
 
@@ -1624,13 +1903,8 @@ class MainWindow(QMainWindow):
         if not name:
             return
         panes = self.visible_panes
-        assign = []
-        for i in range(1, 17):
-            p = self.panes[i - 1]
-            if i <= panes:
-                assign.append(p.assigned_channel)
-            else:
-                assign.append(None)
+        assign = [p.assigned_channel for p in self.panes[:panes]]
+        assign += [None] * (16 - len(assign))
         self.views.save(name, panes, assign)
         self._reload_views_combo()
         self.cmb_views.setCurrentText(name)
@@ -1655,6 +1929,7 @@ class MainWindow(QMainWindow):
             return
         self._cleaned = True
         log.info("shutting down")
+        self._cancel_channel_press()
         self._close_fullscreen_if_any()
         # Flush any pending debounced save synchronously so we don't lose
         # the last state change.
@@ -1666,6 +1941,7 @@ class MainWindow(QMainWindow):
         # Wait for in-flight stop()/release() workers before tearing down the
         # VLC instance.  Otherwise libVLC frees state out from under them.
         join_disposal_threads(timeout_total=3.0)
+        flush_json_writes(timeout=3.0)
         try:
             self.vlc.release()
         except Exception:
@@ -1681,11 +1957,36 @@ def install_sigint_handler(window: MainWindow):
     def _sigint(_signum, _frame):
         QTimer.singleShot(0, window.close)
     signal.signal(signal.SIGINT, _sigint)
-    tick = QTimer()
-    tick.setInterval(200)
-    tick.timeout.connect(lambda: None)
-    tick.start()
-    return tick
+
+    # Python only runs signal handlers when the interpreter gets control,
+    # and the Qt loop can sit in C for as long as it's idle.  With a wakeup
+    # fd, the C-level handler writes a byte to the socket pair; the
+    # notifier wakes the loop and its (Python) slot lets _sigint run.  No
+    # periodic wakeups while idle.  socketpair rather than os.pipe because
+    # Windows only accepts sockets here.
+    try:
+        rsock, wsock = socket.socketpair()
+        rsock.setblocking(False)
+        wsock.setblocking(False)
+        signal.set_wakeup_fd(wsock.fileno())
+    except (OSError, ValueError):
+        # Fallback: a no-op tick keeps returning to Python every 200 ms.
+        tick = QTimer()
+        tick.setInterval(200)
+        tick.timeout.connect(lambda: None)
+        tick.start()
+        return tick
+
+    def _drain():
+        try:
+            rsock.recv(4096)
+        except OSError:
+            pass
+
+    notifier = QSocketNotifier(rsock.fileno(), QSocketNotifier.Read)
+    notifier.activated.connect(_drain)
+    notifier._socks = (rsock, wsock)  # keep both ends open
+    return notifier
 
 
 if __name__ == "__main__":
@@ -2,13 +2,15 @@
 #
 # Code shared between the classic (rtspmatrix.py) and virtual
 # (rtspmatrix-vitual.py) viewers.  Keep this module dependency-light:
-# stdlib + python-vlc + (optionally) PyQt5 are fine, but no project-local
-# imports — both viewers must be able to import it cheaply.
+# stdlib + python-vlc + (optionally) PyQt5 / orjson are fine, but no
+# project-local imports — both viewers must be able to import it cheaply.
 
+import configparser
 import contextlib
 import json
 import logging
 import os
+import queue
 import sys
 import threading
 import time
@@ -46,16 +48,40 @@ except OSError:
         print("  brew install --cask vlc  (macOS)", file=sys.stderr)
     raise SystemExit(1)
 
+# Optional C JSON codec.  Falls back to the stdlib json module transparently.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 log = logging.getLogger("rtspmatrix")
 
 
 # ---------- JSON helpers ----------
 
+_ORJSON_OPTS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+                if orjson is not None else 0)
+
+
+def json_dumps(obj) -> bytes:
+    """UTF-8, 2-space indented JSON with a trailing newline — same output
+    shape either way."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTS)
+    return (json.dumps(obj, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def safe_read_json(path: str, default):
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return _json_loads(f.read())
     except FileNotFoundError:
         return default
     except Exception:
@@ -63,14 +89,117 @@ def safe_read_json(path: str, default):
         return default
 
 
-def safe_write_json(path: str, obj):
-    """Atomic write: serialize to <path>.tmp, then os.replace into place."""
+def safe_write_bytes(path: str, data: bytes):
+    """Atomic write: write to <path>.tmp, fsync, then os.replace into place.
+
+    The fsync makes sure the new contents are on disk before the rename, so
+    a power loss can't leave an empty state.json behind.  Callers on the
+    GUI thread go through the background writer, so it never blocks the UI.
+    """
     tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
     os.replace(tmp, path)
 
 
+def safe_write_json(path: str, obj):
+    safe_write_bytes(path, json_dumps(obj))
+
+
+# Background writer for files saved from button clicks (views.json).  One
+# daemon thread writes pending files in order; if the same path is queued
+# again before its write starts, only the newest object is written, so a
+# burst of saves collapses into a single disk write.
+_json_lock = threading.Lock()
+_json_idle = threading.Condition(_json_lock)
+_json_latest = {}           # path -> newest obj (or bytes) not yet written
+_json_queue = queue.Queue()  # paths, in first-queued order
+_json_worker = None
+_json_busy = False
+
+
+def _json_writer():
+    global _json_busy
+    while True:
+        path = _json_queue.get()
+        with _json_lock:
+            if path not in _json_latest:
+                continue
+            obj = _json_latest.pop(path)
+            _json_busy = True
+        try:
+            if isinstance(obj, bytes):
+                safe_write_bytes(path, obj)
+            else:
+                safe_write_json(path, obj)
+        except Exception:
+            log.exception("Failed to write JSON %s", path)
+        finally:
+            with _json_idle:
+                _json_busy = False
+                _json_idle.notify_all()
+
+
+def safe_write_json_async(path: str, obj):
+    """Queue safe_write_json(path, obj) on the background writer.
+
+    `obj` is serialised later on another thread: pass a snapshot the
+    caller will not mutate afterwards.
+    """
+    global _json_worker
+    with _json_lock:
+        queued = path in _json_latest
+        _json_latest[path] = obj
+        if _json_worker is None:
+            _json_worker = threading.Thread(target=_json_writer, daemon=True,
+                                            name="json-writer")
+            _json_worker.start()
+    if not queued:
+        _json_queue.put(path)
+
+
+def safe_write_bytes_async(path: str, data: bytes):
+    """Same queue as safe_write_json_async, for an already-serialised blob."""
+    safe_write_json_async(path, data)
+
+
+def flush_json_writes(timeout: float = 3.0):
+    """Wait (with a timeout) until every queued background write landed."""
+    with _json_idle:
+        _json_idle.wait_for(lambda: not _json_latest and not _json_busy,
+                            timeout=max(0.0, timeout))
+
+
+# ---------- ini ----------
+
+# abspath -> ((mtime_ns, size), parsed RawConfigParser).  Startup builds
+# more than one RtspConfig from the same file (early logging setup, then
+# the window), so the second one skips the read + parse.
+_INI_CACHE = {}
+
+
+def read_ini(ini_path: str) -> configparser.RawConfigParser:
+    """Parse an ini file, reusing the previous parse while the file is
+    unchanged on disk.  Raises FileNotFoundError if it's missing.  The
+    returned parser is shared: read from it, don't modify it."""
+    try:
+        st = os.stat(ini_path)
+    except OSError:
+        raise FileNotFoundError(f"Missing config file: {ini_path}") from None
+    path = os.path.abspath(ini_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _INI_CACHE.get(path)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    cp = configparser.RawConfigParser(inline_comment_prefixes=())
+    if not cp.read(ini_path, encoding="utf-8"):
+        raise FileNotFoundError(f"Missing config file: {ini_path}")
+    _INI_CACHE[path] = (stamp, cp)
+    return cp
+
+
 # ---------- channel labels ----------
 
 def parse_labels(raw: str) -> list:
@@ -94,78 +223,150 @@ def parse_labels(raw: str) -> list:
 
 # ---------- VLC player disposal ----------
 #
-# All in-flight disposal threads, so MainWindow.cleanup() can join them
-# before releasing the libVLC instance.  Without this the daemon threads
-# may still be running stop()/release() on a MediaPlayer when the parent
+# Players are stopped/released by long-lived daemon workers fed from a
+# queue, rather than one fresh thread per disposal.  A worker is only
+# started when every existing one is busy, up to one per pane of a full
+# grid: a detached player keeps streaming (and holding its DVR session)
+# until stop() runs, and an RTSP stop() can take seconds, so a 16-pane
+# switch must not wait in line behind two workers.  Steady-state churn
+# reuses the same few threads.  Workers are daemons so a wedged stop() can
+# never block interpreter exit.
+#
+# MainWindow.cleanup() calls join_disposal_threads() to wait for the queue
+# to drain before releasing the libVLC instance.  Without this a worker may
+# still be running stop()/release() on a MediaPlayer when the parent
 # vlc.Instance is freed -> use-after-free crash on exit.
-_disposal_threads = []
+_DISPOSE_WORKERS = 16
+_dispose_queue = queue.Queue()
+_dispose_workers = []
 _disposal_lock = threading.Lock()
+_disposal_idle = threading.Condition(_disposal_lock)
+_disposal_pending = 0
 
 
-def dispose_player_async(p: vlc.MediaPlayer):
-    """Stop+release a MediaPlayer on a background thread.
+def _dispose_player(p: vlc.MediaPlayer):
+    try:
+        p.stop()
+    except Exception:
+        log.exception("MediaPlayer.stop() failed during disposal")
+    try:
+        p.release()
+    except Exception:
+        log.exception("MediaPlayer.release() failed during disposal")
+
+
+def _dispose_worker():
+    global _disposal_pending
+    while True:
+        p, on_done = _dispose_queue.get()
+        try:
+            _dispose_player(p)
+            if on_done is not None:
+                try:
+                    on_done()
+                except Exception:
+                    log.exception("disposal on_done callback failed")
+        finally:
+            with _disposal_idle:
+                _disposal_pending -= 1
+                if _disposal_pending == 0:
+                    _disposal_idle.notify_all()
+
+
+def dispose_player_async(p: vlc.MediaPlayer, on_done=None):
+    """Stop+release a MediaPlayer on a background disposal worker.
 
     Detach the OS window handle SYNCHRONOUSLY on the GUI thread first:
     libVLC's render thread may otherwise still try to draw into a freed
     HWND/XWindow/NSView, which is a use-after-free crash on macOS in
     particular.
+
+    `on_done`, if given, is called on the worker thread once the player
+    has been released.
     """
+    global _disposal_pending
     try:
-        if sys.platform.startswith("linux"):
-            p.set_xwindow(0)
-        elif sys.platform.startswith("win"):
-            p.set_hwnd(0)
-        elif sys.platform.startswith("darwin"):
-            p.set_nsobject(0)
-        else:
-            p.set_xwindow(0)
+        _set_drawable(p, 0)
     except Exception:
         log.exception("Detach OS handle failed during disposal")
 
-    def _w():
+    with _disposal_lock:
+        _disposal_pending += 1
+        if (_disposal_pending > len(_dispose_workers)
+                and len(_dispose_workers) < _DISPOSE_WORKERS):
+            t = threading.Thread(target=_dispose_worker, daemon=True,
+                                 name=f"vlc-dispose-{len(_dispose_workers)}")
+            _dispose_workers.append(t)
+            t.start()
+    _dispose_queue.put((p, on_done))
+
+
+def join_disposal_threads(timeout_total: float = 3.0) -> bool:
+    """Wait (with a global timeout) for all queued disposals to finish.
+    Returns False, and logs how many are left, on timeout."""
+    with _disposal_idle:
+        done = _disposal_idle.wait_for(lambda: _disposal_pending == 0,
+                                       timeout=max(0.0, timeout_total))
+        left = _disposal_pending
+    if not done:
+        log.warning("player disposal: %d still pending after %.1fs",
+                    left, timeout_total)
+    return done
+
+
+# The drawable setter for this platform, picked once at import.
+if sys.platform.startswith("win"):
+    _set_drawable = vlc.MediaPlayer.set_hwnd
+elif sys.platform.startswith("darwin"):
+    _set_drawable = vlc.MediaPlayer.set_nsobject
+else:
+    # linux and anything else with X11
+    _set_drawable = vlc.MediaPlayer.set_xwindow
+
+
+def bind_player_to_window(player: vlc.MediaPlayer, winid: int):
+    """Bind a libVLC player to an OS-level window handle for the current
+    platform.  Pass 0 to detach."""
+    _set_drawable(player, int(winid))
+
+
+_vlc_versions = None
+
+
+def vlc_versions():
+    """(python-vlc, libVLC) version strings for the About dialogs; None
+    where unknown.  Looked up on first call only: the metadata lookup
+    walks sys.path, and it isn't worth paying at startup."""
+    global _vlc_versions
+    if _vlc_versions is None:
         try:
-            p.stop()
+            import importlib.metadata
+            pv_vlc = importlib.metadata.version("python-vlc")
         except Exception:
-            log.exception("MediaPlayer.stop() failed during disposal")
+            pv_vlc = None
         try:
-            p.release()
+            libvlc_ver = vlc.libvlc_get_version()
+            if isinstance(libvlc_ver, bytes):
+                libvlc_ver = libvlc_ver.decode("utf-8", errors="ignore")
+            else:
+                libvlc_ver = str(libvlc_ver)
         except Exception:
-            log.exception("MediaPlayer.release() failed during disposal")
-
-    t = threading.Thread(target=_w, daemon=True)
-    with _disposal_lock:
-        _disposal_threads.append(t)
-    t.start()
+            libvlc_ver = None
+        _vlc_versions = (pv_vlc, libvlc_ver)
+    return _vlc_versions
 
 
-def join_disposal_threads(timeout_total: float = 3.0):
-    """Wait (with a global timeout) for all in-flight disposal threads."""
-    deadline = time.monotonic() + timeout_total
-    with _disposal_lock:
-        threads = list(_disposal_threads)
-        _disposal_threads.clear()
-    for t in threads:
-        remaining = max(0.0, deadline - time.monotonic())
-        if remaining <= 0:
-            break
-        try:
-            t.join(timeout=remaining)
-        except Exception:
-            pass
+_platform_string = None
 
 
-def bind_player_to_window(player: vlc.MediaPlayer, winid: int):
-    """Bind a libVLC player to an OS-level window handle for the current
-    platform.  Pass 0 to detach."""
-    wid = int(winid)
-    if sys.platform.startswith("linux"):
-        player.set_xwindow(wid)
-    elif sys.platform.startswith("win"):
-        player.set_hwnd(wid)
-    elif sys.platform.startswith("darwin"):
-        player.set_nsobject(wid)
-    else:
-        player.set_xwindow(wid)
+def platform_string() -> str:
+    """platform.platform(), computed once.  On macOS it re-reads the system
+    version plist on every call."""
+    global _platform_string
+    if _platform_string is None:
+        import platform
+        _platform_string = platform.platform()
+    return _platform_string
 
 
 # ---------- logging setup ----------